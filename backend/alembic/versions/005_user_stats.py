@@ -0,0 +1,43 @@
+"""Add user_stats table with denormalized total points
+
+Revision ID: 005_user_stats
+Revises: 004_add_challenges
+Create Date: 2026-02-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = '005_user_stats'
+down_revision = '004_add_challenges'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+    )
+
+    # Backfill from existing correct submissions (each solved case counts once)
+    op.execute("""
+        INSERT INTO user_stats (user_id, total_points, updated_at)
+        SELECT solved.user_id, SUM(solved.points), NOW()
+        FROM (
+            SELECT DISTINCT s.user_id, c.id, c.points
+            FROM submissions s
+            JOIN cases c ON c.id = s.case_id
+            WHERE s.is_correct = true
+        ) AS solved
+        GROUP BY solved.user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('user_stats')
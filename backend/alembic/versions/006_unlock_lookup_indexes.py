@@ -0,0 +1,46 @@
+"""Add partial composite indexes for unlock lookups
+
+Revision ID: 006_unlock_lookup_indexes
+Revises: 005_user_stats
+Create Date: 2026-02-01 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_unlock_lookup_indexes'
+down_revision = '005_user_stats'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Solved-case lookups only ever look at correct submissions
+    op.create_index(
+        'ix_submissions_user_case_correct',
+        'submissions',
+        ['user_id', 'case_id'],
+        postgresql_where=sa.text('is_correct = true'),
+    )
+
+    # Manual unlocks target either a case or an artifact
+    op.create_index(
+        'ix_manual_unlocks_user_case',
+        'manual_unlocks',
+        ['user_id', 'case_id'],
+        postgresql_where=sa.text('case_id IS NOT NULL'),
+    )
+    op.create_index(
+        'ix_manual_unlocks_user_artifact',
+        'manual_unlocks',
+        ['user_id', 'artifact_id'],
+        postgresql_where=sa.text('artifact_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_manual_unlocks_user_artifact', table_name='manual_unlocks')
+    op.drop_index('ix_manual_unlocks_user_case', table_name='manual_unlocks')
+    op.drop_index('ix_submissions_user_case_correct', table_name='submissions')
@@ -0,0 +1,30 @@
+"""Add partial index for admin user lookups
+
+Revision ID: 007_users_admin_index
+Revises: 006_unlock_lookup_indexes
+Create Date: 2026-02-02 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_users_admin_index'
+down_revision = '006_unlock_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Admin-existence checks only need the few admin rows
+    op.create_index(
+        'ix_users_is_admin',
+        'users',
+        ['id'],
+        postgresql_where=sa.text('is_admin = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_is_admin', table_name='users')
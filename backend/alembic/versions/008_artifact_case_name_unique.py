@@ -0,0 +1,101 @@
+"""Make artifact names unique within a case
+
+Revision ID: 008_artifact_case_name_unique
+Revises: 007_users_admin_index
+Create Date: 2026-02-02 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_artifact_case_name_unique'
+down_revision = '007_users_admin_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Earlier seed/update scripts could insert the same artifact name twice
+    # for a case. Keep the most recently updated row of each (case_id, name)
+    # and move everything that references the others over to it.
+    op.execute("""
+        CREATE TEMP TABLE artifact_duplicates AS
+        SELECT id AS duplicate_id, keep_id
+        FROM (
+            SELECT
+                id,
+                FIRST_VALUE(id) OVER (
+                    PARTITION BY case_id, name
+                    ORDER BY updated_at DESC, created_at DESC, id
+                ) AS keep_id
+            FROM artifacts
+        ) AS ranked
+        WHERE id <> keep_id
+    """)
+
+    # One download row per (user, artifact): merge the counts
+    op.execute("""
+        CREATE TEMP TABLE merged_artifact_downloads AS
+        SELECT
+            (ARRAY_AGG(d.id ORDER BY d.first_downloaded_at))[1] AS id,
+            d.user_id,
+            COALESCE(m.keep_id, d.artifact_id) AS artifact_id,
+            MIN(d.first_downloaded_at) AS first_downloaded_at,
+            SUM(d.download_count) AS download_count
+        FROM user_artifact_downloads d
+        LEFT JOIN artifact_duplicates m ON m.duplicate_id = d.artifact_id
+        WHERE d.artifact_id IN (
+            SELECT duplicate_id FROM artifact_duplicates
+            UNION
+            SELECT keep_id FROM artifact_duplicates
+        )
+        GROUP BY d.user_id, COALESCE(m.keep_id, d.artifact_id)
+    """)
+    op.execute("""
+        DELETE FROM user_artifact_downloads
+        WHERE artifact_id IN (
+            SELECT duplicate_id FROM artifact_duplicates
+            UNION
+            SELECT keep_id FROM artifact_duplicates
+        )
+    """)
+    op.execute("""
+        INSERT INTO user_artifact_downloads
+            (id, user_id, artifact_id, first_downloaded_at, download_count)
+        SELECT id, user_id, artifact_id, first_downloaded_at, download_count
+        FROM merged_artifact_downloads
+    """)
+
+    for table, column in (
+        ('artifact_unlock_conditions', 'artifact_id'),
+        ('artifact_unlock_conditions', 'required_artifact_id'),
+        ('case_dependencies', 'required_artifact_id'),
+        ('manual_unlocks', 'artifact_id'),
+        ('telemetry_events', 'artifact_id'),
+    ):
+        op.execute(f"""
+            UPDATE {table} AS t
+            SET {column} = m.keep_id
+            FROM artifact_duplicates m
+            WHERE t.{column} = m.duplicate_id
+        """)
+
+    op.execute("""
+        DELETE FROM artifacts
+        WHERE id IN (SELECT duplicate_id FROM artifact_duplicates)
+    """)
+    op.execute("DROP TABLE merged_artifact_downloads")
+    op.execute("DROP TABLE artifact_duplicates")
+
+    # Conflict target for seed script upserts
+    op.create_unique_constraint(
+        'uq_artifact_case_name',
+        'artifacts',
+        ['case_id', 'name'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_artifact_case_name', 'artifacts', type_='unique')
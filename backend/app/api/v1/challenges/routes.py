@@ -89,11 +89,10 @@ async def submit_challenge_answer(
     # Normalize the submitted answer
     submitted_answer = submission.answer.strip()
     
-    # Hash the submitted answer
-    submitted_hash = crypto_service.hash_semantic_truth(submitted_answer)
-    
-    # Check if answer is correct
-    is_correct = submitted_hash == challenge_row.semantic_truth_hash
+    # Check if answer is correct (hashed, constant-time comparison)
+    is_correct = crypto_service.verify_answer(
+        submitted_answer, challenge_row.semantic_truth_hash
+    )
     
     # Calculate points
     points_awarded = challenge_row.points if is_correct and not already_solved else 0
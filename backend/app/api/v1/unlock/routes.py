@@ -69,7 +69,7 @@ async def get_accessible_cases(
         user_id=current_user.id,
         cases=[
             CaseAccessStatus(
-                case_id=UUID(c["case_id"]),
+                case_id=c["case_id"],
                 title=c["title"],
                 slug=c["slug"],
                 difficulty=c["difficulty"],
@@ -118,7 +118,7 @@ async def get_case_artifacts_access(
         user_id=current_user.id,
         artifacts=[
             ArtifactAccessStatus(
-                artifact_id=UUID(a["artifact_id"]),
+                artifact_id=a["artifact_id"],
                 name=a["name"],
                 description=a.get("description"),
                 artifact_type=a["artifact_type"],
@@ -194,11 +194,11 @@ async def get_case_dependencies(
         case_id=case_id,
         dependencies=[
             CaseDependencyResponse(
-                dependency_id=UUID(d["dependency_id"]),
+                dependency_id=d["dependency_id"],
                 case_id=case_id,
-                required_case_id=UUID(d["required_case_id"]),
+                required_case_id=d["required_case_id"],
                 required_case_title=d["required_case_title"],
-                required_artifact_id=UUID(d["required_artifact_id"]) if d["required_artifact_id"] else None,
+                required_artifact_id=d["required_artifact_id"],
                 lock_reason=d["lock_reason"],
                 created_at=None,
             )
@@ -292,11 +292,11 @@ async def get_artifact_unlock_conditions(
         artifact_id=artifact_id,
         conditions=[
             ArtifactUnlockConditionResponse(
-                condition_id=UUID(c["condition_id"]),
+                condition_id=c["condition_id"],
                 artifact_id=artifact_id,
-                condition_type=UnlockConditionType(c["condition_type"]),
-                required_case_id=UUID(c["required_case_id"]) if c["required_case_id"] else None,
-                required_artifact_id=UUID(c["required_artifact_id"]) if c["required_artifact_id"] else None,
+                condition_type=c["condition_type"],
+                required_case_id=c["required_case_id"],
+                required_artifact_id=c["required_artifact_id"],
                 unlock_at=c["unlock_at"],
                 required_points=c["required_points"],
                 description=c["description"],
@@ -465,11 +465,11 @@ async def get_user_manual_unlocks(
         user_id=user_id,
         unlocks=[
             ManualUnlockResponse(
-                unlock_id=UUID(u["unlock_id"]),
+                unlock_id=u["unlock_id"],
                 user_id=user_id,
-                artifact_id=UUID(u["artifact_id"]) if u["artifact_id"] else None,
-                case_id=UUID(u["case_id"]) if u["case_id"] else None,
-                granted_by=UUID(u["granted_by"]) if u["granted_by"] else None,
+                artifact_id=u["artifact_id"],
+                case_id=u["case_id"],
+                granted_by=u["granted_by"],
                 reason=u["reason"],
                 created_at=u["created_at"],
             )
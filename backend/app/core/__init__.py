@@ -2,5 +2,6 @@
 from .config import settings
 from .security import SecurityService
 from .crypto import CryptoService
+from .password_hasher import low_memory_hasher
 
-__all__ = ["settings", "SecurityService", "CryptoService"]
+__all__ = ["settings", "SecurityService", "CryptoService", "low_memory_hasher"]
@@ -61,6 +61,8 @@ class Settings(BaseSettings):
     ARGON2_PARALLELISM: int = 4
     ARGON2_HASH_LEN: int = 32
     ARGON2_SALT_LEN: int = 16
+    # Concurrent hash/verify operations per worker (each uses ARGON2_MEMORY_COST)
+    PASSWORD_HASH_WORKERS: int = 2
     
     # Database
     POSTGRES_HOST: str = "localhost"
@@ -0,0 +1,21 @@
+"""
+Low-memory Argon2 hasher for the admin bootstrap scripts.
+
+The scripts may run in small containers where the application's Argon2
+settings (64 MB per hash) don't fit. Hashes made here are ordinary Argon2id
+hashes, so SecurityService verifies them and upgrades them to the
+application's parameters on the next login (see needs_rehash).
+"""
+
+from argon2 import PasswordHasher
+
+
+# Single place for the script hashing parameters. Memory is the main work
+# factor; parallelism stays at 1 so it never exceeds the available cores.
+low_memory_hasher = PasswordHasher(
+    time_cost=2,
+    memory_cost=16384,  # 16 MB instead of 64 MB
+    parallelism=1,
+    hash_len=32,
+    salt_len=16,
+)
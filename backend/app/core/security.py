@@ -3,9 +3,10 @@ Security service for authentication and authorization.
 Implements Argon2 password hashing and JWT token management.
 """
 
+import base64
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError, InvalidHashError
@@ -155,6 +156,26 @@ class SecurityService:
         """
         return secrets.token_urlsafe(length)
     
+    @staticmethod
+    def generate_invite_codes_bulk(count: int, length: int = 16) -> List[str]:
+        """
+        Generate many invite codes from a single read of the system RNG.
+        
+        Codes have the same format as generate_invite_code.
+        
+        Args:
+            count: Number of invite codes to generate.
+            length: Number of random bytes per invite code.
+        
+        Returns:
+            List of secure random invite codes.
+        """
+        raw = secrets.token_bytes(count * length)
+        return [
+            base64.urlsafe_b64encode(raw[i:i + length]).rstrip(b"=").decode("ascii")
+            for i in range(0, count * length, length)
+        ]
+    
     @staticmethod
     def generate_secure_token(length: int = 32) -> str:
         """
@@ -25,6 +25,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -147,6 +148,15 @@ class User(Base, TimestampMixin):
         lazy="selectin",
     )
     
+    # Admin lookups only ever look at the handful of admin rows
+    __table_args__ = (
+        Index(
+            "ix_users_is_admin",
+            "id",
+            postgresql_where=text("is_admin = true"),
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<User {self.username} ({self.email})>"
 
@@ -214,6 +224,13 @@ class InviteCode(Base, TimestampMixin):
         nullable=False,
     )
     
+    # Relationships
+    # Lets the user INSERT and the invite UPDATE go out in a single flush
+    used_by: Mapped[Optional["User"]] = relationship(
+        "User",
+        foreign_keys=[used_by_id],
+    )
+    
     def __repr__(self) -> str:
         return f"<InviteCode {self.code[:8]}... used={self.is_used}>"
     
@@ -423,6 +440,11 @@ class Artifact(Base, TimestampMixin):
         back_populates="artifacts",
     )
     
+    __table_args__ = (
+        # Seed scripts upsert artifacts by name within a case
+        UniqueConstraint("case_id", "name", name="uq_artifact_case_name"),
+    )
+    
     def __repr__(self) -> str:
         return f"<Artifact {self.name} ({self.artifact_type.value})>"
 
@@ -507,6 +529,13 @@ class Submission(Base, TimestampMixin):
     __table_args__ = (
         Index("ix_submissions_user_case", "user_id", "case_id"),
         Index("ix_submissions_correct", "is_correct"),
+        # Solved-case lookups (unlock checks, already-solved, points)
+        Index(
+            "ix_submissions_user_case_correct",
+            "user_id",
+            "case_id",
+            postgresql_where=text("is_correct = true"),
+        ),
     )
     
     def __repr__(self) -> str:
@@ -839,8 +868,55 @@ class ManualUnlock(Base, TimestampMixin):
         Index("ix_manual_unlocks_user", "user_id"),
         Index("ix_manual_unlocks_artifact", "artifact_id"),
         Index("ix_manual_unlocks_case", "case_id"),
+        # Per-target unlock lookups
+        Index(
+            "ix_manual_unlocks_user_case",
+            "user_id",
+            "case_id",
+            postgresql_where=text("case_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_manual_unlocks_user_artifact",
+            "user_id",
+            "artifact_id",
+            postgresql_where=text("artifact_id IS NOT NULL"),
+        ),
     )
     
     def __repr__(self) -> str:
         target = f"artifact={self.artifact_id}" if self.artifact_id else f"case={self.case_id}"
         return f"<ManualUnlock user={self.user_id} {target}>"
+
+
+class UserStats(Base):
+    """
+    Denormalized per-user totals.
+    
+    total_points is kept up to date when a case is first solved (and when
+    a solved case's points change or it is deleted), so points-threshold
+    unlock checks read one row instead of summing submissions.
+    """
+    
+    __tablename__ = "user_stats"
+    
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    
+    total_points: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+    
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    
+    def __repr__(self) -> str:
+        return f"<UserStats user={self.user_id} points={self.total_points}>"
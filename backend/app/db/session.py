@@ -2,13 +2,13 @@
 Database session management for async SQLAlchemy.
 """
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 
@@ -47,6 +47,11 @@ def get_sync_engine():
             settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"),
             echo=settings.DEBUG,
             poolclass=NullPool,
+            # Bulk INSERTs go out as multi-row VALUES and other executemany
+            # calls (UPDATE/DELETE) through psycopg2's execute_batch
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
         )
     return _sync_engine
 
@@ -84,6 +89,37 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Session.info key holding callbacks queued by run_after_commit
+_AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run a callback once the session's current transaction commits.
+    
+    The callback is discarded if the transaction rolls back instead. Use this
+    for side effects (e.g. background telemetry) that must only happen for
+    changes that were actually committed.
+    
+    Args:
+        session: The (async) session whose transaction to wait for.
+        callback: Synchronous callable taking no arguments.
+    """
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info.setdefault(_AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_CALLBACKS, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_CALLBACKS, None)
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
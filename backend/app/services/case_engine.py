@@ -12,13 +12,14 @@ import re
 from typing import Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..core.crypto import crypto_service
 from ..db.models import Case, Artifact, Submission, User, DifficultyLevel
 from ..schemas.case import CaseCreate, CaseUpdate
+from .user_service import user_service
 
 
 class CaseEngine:
@@ -118,10 +119,10 @@ class CaseEngine:
         counter = 1
         
         while True:
-            result = await db.execute(
-                select(Case).where(Case.slug == slug).limit(1)
+            slug_taken = await db.scalar(
+                select(exists().where(Case.slug == slug))
             )
-            if result.scalar_one_or_none() is None:
+            if not slug_taken:
                 return slug
             
             slug = f"{base_slug}-{counter}"
@@ -156,9 +157,14 @@ class CaseEngine:
             return None
         
         update_data = case_data.model_dump(exclude_unset=True)
+        old_points = case.points
         for field, value in update_data.items():
             setattr(case, field, value)
         
+        # Stored user totals include this case's points for every solver
+        if case.points != old_points:
+            await user_service.adjust_points_for_case(db, case.id, case.points - old_points)
+        
         await db.flush()
         await db.refresh(case)
         
@@ -399,16 +405,15 @@ class CaseEngine:
             Dictionary with user's case status.
         """
         # Check if solved
-        solved_result = await db.execute(
-            select(Submission)
-            .where(
-                Submission.user_id == user_id,
-                Submission.case_id == case_id,
-                Submission.is_correct == True,
+        is_solved = bool(await db.scalar(
+            select(
+                exists().where(
+                    Submission.user_id == user_id,
+                    Submission.case_id == case_id,
+                    Submission.is_correct == True,
+                )
             )
-            .limit(1)
-        )
-        is_solved = solved_result.scalar_one_or_none() is not None
+        ))
         
         # Count attempts
         attempts_result = await db.execute(
@@ -452,6 +457,9 @@ class CaseEngine:
         if not case:
             return False
         
+        # Solvers lose this case's points along with its submissions
+        await user_service.adjust_points_for_case(db, case.id, -case.points)
+        
         await db.delete(case)
         await db.flush()
         
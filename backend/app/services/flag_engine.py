@@ -24,12 +24,13 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, exists, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import settings
 from ..core.crypto import CryptoService, crypto_service
 from ..db.models import Case, User, Submission
+from .user_service import user_service
 
 
 class FlagEngine:
@@ -217,15 +218,20 @@ class FlagEngine:
         # Rotate user salt if needed (anti-leak: old flags expire)
         user = await self.maybe_rotate_user_salt(db, user)
         
-        # Check if user already solved this case
-        already_solved = await self._check_already_solved(db, user.id, case.id)
-        
         # Verify the answer
         is_correct = self.verify_answer(
             submitted_answer=submitted_answer,
             stored_semantic_truth_hash=case.semantic_truth_hash,
         )
         
+        # Check if user already solved this case. The user's stats row is
+        # locked first, so a concurrent correct submission for the same case
+        # commits before this check and its points aren't added twice.
+        already_solved = False
+        if is_correct:
+            await user_service.lock_user_stats(db, user.id)
+            already_solved = await self._check_already_solved(db, user.id, case.id)
+        
         # Hash the submitted answer for storage (privacy - never store plaintext)
         submitted_answer_hash = self._crypto.hash_semantic_truth(submitted_answer)
         
@@ -242,6 +248,10 @@ class FlagEngine:
         db.add(submission)
         await db.flush()
         
+        if is_correct and not already_solved:
+            # Keep the stored points total (used by unlock checks) current
+            await user_service.add_solve_points(db, user.id, case.points)
+        
         if is_correct:
             # Generate unique, time-limited flag for this user
             flag = self.generate_flag_for_user(
@@ -284,16 +294,20 @@ class FlagEngine:
         case_id: UUID,
     ) -> bool:
         """Check if a user has already solved a case."""
-        result = await db.execute(
-            select(Submission)
-            .where(
-                Submission.user_id == user_id,
-                Submission.case_id == case_id,
-                Submission.is_correct == True,
+        # lambda_stmt caches the constructed statement; user_id/case_id
+        # become bound parameters
+        already_solved = await db.scalar(
+            lambda_stmt(
+                lambda: select(
+                    exists().where(
+                        Submission.user_id == user_id,
+                        Submission.case_id == case_id,
+                        Submission.is_correct == True,
+                    )
+                )
             )
-            .limit(1)
         )
-        return result.scalar_one_or_none() is not None
+        return bool(already_solved)
     
     async def get_user_attempts_count(
         self,
@@ -303,10 +317,12 @@ class FlagEngine:
     ) -> int:
         """Get the number of attempts a user has made on a case."""
         result = await db.execute(
-            select(func.count(Submission.id))
-            .where(
-                Submission.user_id == user_id,
-                Submission.case_id == case_id,
+            lambda_stmt(
+                lambda: select(func.count(Submission.id))
+                .where(
+                    Submission.user_id == user_id,
+                    Submission.case_id == case_id,
+                )
             )
         )
         return result.scalar() or 0
@@ -11,9 +11,10 @@ This service provides hooks for tracking user activity
 without compromising user privacy or leaking sensitive data.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Set
 from uuid import UUID
 
 from sqlalchemy import select, func
@@ -24,6 +25,7 @@ from ..db.models import (
     TelemetryEventType,
     UserArtifactDownload,
 )
+from ..db.session import SessionLocal
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,10 @@ class TelemetryService:
     Telemetry failures should never impact user experience.
     """
     
+    def __init__(self):
+        # Strong references so scheduled hooks aren't garbage collected mid-run
+        self._background_tasks: Set[asyncio.Task] = set()
+    
     @staticmethod
     def _sanitize_extra_data(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """
@@ -136,6 +142,50 @@ class TelemetryService:
             logger.error(f"Telemetry: Failed to record event: {e}")
             return None
     
+    # ===== Background Scheduling =====
+    
+    def schedule(
+        self,
+        hook: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Run a telemetry hook in the background, off the caller's request path.
+        
+        The hook gets its own database session (the caller's session may be
+        closed by the time it runs) and is committed independently.
+        
+        Args:
+            hook: A hook method taking a session as its first argument,
+                e.g. telemetry_service.on_case_unlocked
+            *args: Remaining positional arguments for the hook
+            **kwargs: Keyword arguments for the hook
+        """
+        task = asyncio.get_running_loop().create_task(
+            self._run_in_own_session(hook, *args, **kwargs)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _run_in_own_session(
+        self,
+        hook: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        try:
+            async with SessionLocal() as db:
+                await hook(db, *args, **kwargs)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Telemetry: Background hook {hook.__name__} failed: {e}")
+    
+    async def drain(self) -> None:
+        """Wait for scheduled hooks to finish (call on shutdown)."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+    
     # ===== Convenience Methods (Telemetry Hooks) =====
     
     async def on_case_viewed(
@@ -9,10 +9,10 @@ Handles:
 """
 
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, and_, or_, exists, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db.models import (
@@ -24,7 +24,9 @@ from ..db.models import (
     UserArtifactDownload,
     ManualUnlock,
     UnlockConditionType,
+    UserStats,
 )
+from ..db.session import run_after_commit
 from .telemetry_service import telemetry_service
 
 
@@ -46,6 +48,7 @@ class UnlockEngine:
         db: AsyncSession,
         user_id: UUID,
         case_id: UUID,
+        subproblem_cache: Optional[Dict[tuple, Any]] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
         Check if a case is accessible to a user.
@@ -59,66 +62,161 @@ class UnlockEngine:
             db: Database session
             user_id: The user to check
             case_id: The case to check
+            subproblem_cache: Optional per-request memo shared across checks,
+                keyed ("solved", user_id, case_id) / ("dl", user_id, artifact_id)
+                / ("points", user_id)
         
         Returns:
             Tuple of (is_accessible, lock_reason_if_locked)
         """
         # Check for manual unlock first (fastest path)
-        manual_unlock = await db.execute(
-            select(ManualUnlock).where(
-                ManualUnlock.user_id == user_id,
-                ManualUnlock.case_id == case_id,
+        has_manual_unlock = await db.scalar(
+            lambda_stmt(
+                lambda: select(
+                    exists().where(
+                        ManualUnlock.user_id == user_id,
+                        ManualUnlock.case_id == case_id,
+                    )
+                )
             )
         )
-        if manual_unlock.scalar_one_or_none():
+        if has_manual_unlock:
             return (True, None)
         
-        # Get all dependencies for this case
+        # Fetch every dependency together with its satisfaction status in a
+        # single roundtrip instead of querying per dependency.
         deps_result = await db.execute(
-            select(CaseDependency).where(CaseDependency.case_id == case_id)
+            lambda_stmt(
+                lambda: select(
+                    CaseDependency,
+                    Case.title,
+                    Submission.id.label("solved"),
+                    UserArtifactDownload.id.label("downloaded"),
+                )
+                .select_from(CaseDependency)
+                .join(Case, Case.id == CaseDependency.required_case_id)
+                .outerjoin(
+                    Submission,
+                    and_(
+                        Submission.case_id == CaseDependency.required_case_id,
+                        Submission.user_id == user_id,
+                        Submission.is_correct == True,
+                    ),
+                )
+                .outerjoin(
+                    UserArtifactDownload,
+                    and_(
+                        UserArtifactDownload.artifact_id == CaseDependency.required_artifact_id,
+                        UserArtifactDownload.user_id == user_id,
+                    ),
+                )
+                .where(CaseDependency.case_id == case_id)
+            )
         )
-        dependencies = list(deps_result.scalars().all())
         
-        # No dependencies = accessible
-        if not dependencies:
-            return (True, None)
-        
-        # Check each dependency
-        for dep in dependencies:
-            # Check if user has solved the required case
-            solved_result = await db.execute(
-                select(Submission).where(
-                    Submission.user_id == user_id,
-                    Submission.case_id == dep.required_case_id,
-                    Submission.is_correct == True,
-                ).limit(1)
-            )
+        # No dependencies = accessible (loop body never runs)
+        for dep, required_title, solved, downloaded in deps_result.all():
+            if subproblem_cache is not None:
+                subproblem_cache[("solved", user_id, dep.required_case_id)] = solved is not None
+                if dep.required_artifact_id:
+                    subproblem_cache[("dl", user_id, dep.required_artifact_id)] = downloaded is not None
             
-            if solved_result.scalar_one_or_none() is None:
-                # Get the required case title for the lock reason
-                required_case = await db.execute(
-                    select(Case.title).where(Case.id == dep.required_case_id)
-                )
-                required_title = required_case.scalar() or "another case"
-                
-                reason = dep.lock_reason or f"You must solve '{required_title}' first."
+            if solved is None:
+                reason = dep.lock_reason or f"You must solve '{required_title or 'another case'}' first."
                 return (False, reason)
             
             # If dependency also requires a specific artifact to be downloaded
-            if dep.required_artifact_id:
-                download_result = await db.execute(
-                    select(UserArtifactDownload).where(
-                        UserArtifactDownload.user_id == user_id,
-                        UserArtifactDownload.artifact_id == dep.required_artifact_id,
-                    )
-                )
-                
-                if download_result.scalar_one_or_none() is None:
-                    reason = dep.lock_reason or "You must download a required artifact first."
-                    return (False, reason)
+            if dep.required_artifact_id and downloaded is None:
+                reason = dep.lock_reason or "You must download a required artifact first."
+                return (False, reason)
         
         return (True, None)
     
+    async def check_cases_accessible(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        case_ids: Iterable[UUID],
+    ) -> Dict[UUID, Tuple[bool, Optional[str]]]:
+        """
+        Check several cases for one user with a fixed number of queries.
+        
+        Args:
+            db: Database session
+            user_id: The user to check
+            case_ids: The cases to check
+        
+        Returns:
+            Dict of case_id -> (is_accessible, lock_reason_if_locked)
+        """
+        case_ids = set(case_ids)
+        results: Dict[UUID, Tuple[bool, Optional[str]]] = {
+            case_id: (True, None) for case_id in case_ids
+        }
+        
+        if not case_ids:
+            return results
+        
+        manual_case_ids = set(await db.scalars(
+            select(ManualUnlock.case_id).where(
+                ManualUnlock.user_id == user_id,
+                ManualUnlock.case_id.in_(case_ids),
+            )
+        ))
+        pending_case_ids = case_ids - manual_case_ids
+        if not pending_case_ids:
+            return results
+        
+        deps_result = await db.execute(
+            select(
+                CaseDependency.case_id,
+                CaseDependency.required_case_id,
+                CaseDependency.required_artifact_id,
+                CaseDependency.lock_reason,
+                Case.title,
+            )
+            .join(Case, Case.id == CaseDependency.required_case_id)
+            .where(CaseDependency.case_id.in_(pending_case_ids))
+        )
+        deps_by_case: Dict[UUID, List[tuple]] = {}
+        # Rows are (case_id, required_case_id, required_artifact_id,
+        # lock_reason, required_case_title)
+        for dep_case_id, *dependency in deps_result.all():
+            deps_by_case.setdefault(dep_case_id, []).append(tuple(dependency))
+        
+        required_case_ids = {dep[0] for deps in deps_by_case.values() for dep in deps}
+        required_artifact_ids = {
+            dep[1] for deps in deps_by_case.values() for dep in deps if dep[1]
+        }
+        
+        solved_case_ids: Set[UUID] = set()
+        if required_case_ids:
+            solved_case_ids = set(await db.scalars(
+                select(Submission.case_id).where(
+                    Submission.user_id == user_id,
+                    Submission.case_id.in_(required_case_ids),
+                    Submission.is_correct == True,
+                ).distinct()
+            ))
+        
+        downloaded_artifact_ids: Set[UUID] = set()
+        if required_artifact_ids:
+            downloaded_artifact_ids = set(await db.scalars(
+                select(UserArtifactDownload.artifact_id).where(
+                    UserArtifactDownload.user_id == user_id,
+                    UserArtifactDownload.artifact_id.in_(required_artifact_ids),
+                )
+            ))
+        
+        for case_id in pending_case_ids:
+            results[case_id] = self._evaluate_case_dependencies(
+                deps_by_case.get(case_id, ()),
+                solved_case_ids,
+                downloaded_artifact_ids,
+            )
+        
+        return results
+    
     async def get_case_dependencies(
         self,
         db: AsyncSession,
@@ -131,27 +229,28 @@ class UnlockEngine:
             List of dependency details including required case info
         """
         deps_result = await db.execute(
-            select(CaseDependency).where(CaseDependency.case_id == case_id)
-        )
-        dependencies = list(deps_result.scalars().all())
-        
-        result = []
-        for dep in dependencies:
-            # Get required case info
-            case_result = await db.execute(
-                select(Case).where(Case.id == dep.required_case_id)
+            select(
+                CaseDependency.id,
+                CaseDependency.required_case_id,
+                CaseDependency.required_artifact_id,
+                CaseDependency.lock_reason,
+                Case.title,
             )
-            required_case = case_result.scalar_one_or_none()
-            
-            result.append({
-                "dependency_id": str(dep.id),
-                "required_case_id": str(dep.required_case_id),
-                "required_case_title": required_case.title if required_case else None,
-                "required_artifact_id": str(dep.required_artifact_id) if dep.required_artifact_id else None,
-                "lock_reason": dep.lock_reason,
-            })
+            .outerjoin(Case, Case.id == CaseDependency.required_case_id)
+            .where(CaseDependency.case_id == case_id)
+        )
         
-        return result
+        return [
+            {
+                "dependency_id": dependency_id,
+                "required_case_id": required_case_id,
+                "required_case_title": required_title,
+                "required_artifact_id": required_artifact_id,
+                "lock_reason": lock_reason,
+            }
+            for dependency_id, required_case_id, required_artifact_id, lock_reason, required_title
+            in deps_result.all()
+        ]
     
     async def add_case_dependency(
         self,
@@ -183,7 +282,6 @@ class UnlockEngine:
         
         db.add(dependency)
         await db.flush()
-        await db.refresh(dependency)
         
         return dependency
     
@@ -212,6 +310,7 @@ class UnlockEngine:
         db: AsyncSession,
         user_id: UUID,
         artifact_id: UUID,
+        subproblem_cache: Optional[Dict[tuple, Any]] = None,
     ) -> Tuple[bool, Optional[str]]:
         """
         Check if an artifact is accessible to a user.
@@ -225,36 +324,55 @@ class UnlockEngine:
             db: Database session
             user_id: The user to check
             artifact_id: The artifact to check
+            subproblem_cache: Optional per-request memo shared across checks
         
         Returns:
             Tuple of (is_accessible, lock_reason_if_locked)
         """
         # Check for manual unlock first
-        manual_unlock = await db.execute(
-            select(ManualUnlock).where(
-                ManualUnlock.user_id == user_id,
-                ManualUnlock.artifact_id == artifact_id,
+        has_manual_unlock = await db.scalar(
+            lambda_stmt(
+                lambda: select(
+                    exists().where(
+                        ManualUnlock.user_id == user_id,
+                        ManualUnlock.artifact_id == artifact_id,
+                    )
+                )
             )
         )
-        if manual_unlock.scalar_one_or_none():
+        if has_manual_unlock:
             return (True, None)
         
         # Get all unlock conditions for this artifact
         conditions_result = await db.execute(
-            select(ArtifactUnlockCondition).where(
-                ArtifactUnlockCondition.artifact_id == artifact_id
+            lambda_stmt(
+                lambda: select(ArtifactUnlockCondition).where(
+                    ArtifactUnlockCondition.artifact_id == artifact_id
+                )
             )
         )
-        conditions = list(conditions_result.scalars().all())
+        now = datetime.now(timezone.utc)
+        conditions = self._pending_conditions(conditions_result.scalars().all(), now)
         
-        # No conditions = accessible
+        # No conditions (or only elapsed time locks) = accessible
         if not conditions:
             return (True, None)
         
+        solved_case_ids, downloaded_artifact_ids, total_points, case_titles = (
+            await self._prefetch_condition_state(
+                db, user_id, conditions, subproblem_cache=subproblem_cache
+            )
+        )
+        
         # Check each condition
         for condition in conditions:
-            is_met, reason = await self._check_unlock_condition(
-                db, user_id, condition
+            is_met, reason = self._evaluate_condition(
+                condition,
+                solved_case_ids,
+                downloaded_artifact_ids,
+                total_points,
+                now,
+                case_titles,
             )
             
             if not is_met:
@@ -262,79 +380,169 @@ class UnlockEngine:
         
         return (True, None)
     
-    async def _check_unlock_condition(
+    async def _prefetch_condition_state(
         self,
         db: AsyncSession,
         user_id: UUID,
+        conditions: List[ArtifactUnlockCondition],
+        downloaded_artifact_ids: Optional[Set[UUID]] = None,
+        subproblem_cache: Optional[Dict[tuple, Any]] = None,
+    ) -> Tuple[Set[UUID], Set[UUID], int, Dict[UUID, str]]:
+        """
+        Load the user state needed to evaluate a batch of unlock conditions.
+        
+        Only the queries required by the given condition types are issued.
+        
+        Args:
+            db: Database session
+            user_id: The user to check
+            conditions: Conditions that will be evaluated
+            downloaded_artifact_ids: Already-known downloaded artifacts (skips the lookup)
+            subproblem_cache: Optional per-request memo; answers found there are
+                not re-queried and new answers are stored back
+        
+        Returns:
+            Tuple of (solved_case_ids, downloaded_artifact_ids, total_points,
+            titles of required cases the user has not solved)
+        """
+        required_case_ids = {
+            c.required_case_id for c in conditions
+            if c.condition_type == UnlockConditionType.CASE_SOLVED and c.required_case_id
+        }
+        required_artifact_ids = {
+            c.required_artifact_id for c in conditions
+            if c.condition_type == UnlockConditionType.ARTIFACT_DOWNLOADED and c.required_artifact_id
+        }
+        needs_points = any(
+            c.condition_type == UnlockConditionType.POINTS_THRESHOLD and c.required_points
+            for c in conditions
+        )
+        
+        memo = subproblem_cache if subproblem_cache is not None else {}
+        
+        solved_case_ids: Set[UUID] = set()
+        case_titles: Dict[UUID, str] = {}
+        if required_case_ids:
+            unknown_case_ids = {
+                cid for cid in required_case_ids if ("solved", user_id, cid) not in memo
+            }
+            if unknown_case_ids:
+                newly_solved = set(await db.scalars(
+                    select(Submission.case_id).where(
+                        Submission.user_id == user_id,
+                        Submission.case_id.in_(unknown_case_ids),
+                        Submission.is_correct == True,
+                    ).distinct()
+                ))
+                for cid in unknown_case_ids:
+                    memo[("solved", user_id, cid)] = cid in newly_solved
+            
+            solved_case_ids = {
+                cid for cid in required_case_ids if memo[("solved", user_id, cid)]
+            }
+            
+            unsolved_case_ids = required_case_ids - solved_case_ids
+            if unsolved_case_ids:
+                titles_result = await db.execute(
+                    select(Case.id, Case.title).where(Case.id.in_(unsolved_case_ids))
+                )
+                case_titles = dict(titles_result.all())
+        
+        if downloaded_artifact_ids is None:
+            downloaded_artifact_ids = set()
+            if required_artifact_ids:
+                unknown_artifact_ids = {
+                    aid for aid in required_artifact_ids if ("dl", user_id, aid) not in memo
+                }
+                if unknown_artifact_ids:
+                    newly_downloaded = set(await db.scalars(
+                        select(UserArtifactDownload.artifact_id).where(
+                            UserArtifactDownload.user_id == user_id,
+                            UserArtifactDownload.artifact_id.in_(unknown_artifact_ids),
+                        )
+                    ))
+                    for aid in unknown_artifact_ids:
+                        memo[("dl", user_id, aid)] = aid in newly_downloaded
+                
+                downloaded_artifact_ids = {
+                    aid for aid in required_artifact_ids if memo[("dl", user_id, aid)]
+                }
+        
+        total_points = 0
+        if needs_points:
+            if ("points", user_id) not in memo:
+                # Stored total, maintained when cases are first solved
+                total = await db.scalar(
+                    select(UserStats.total_points).where(UserStats.user_id == user_id)
+                )
+                memo[("points", user_id)] = total or 0
+            total_points = memo[("points", user_id)]
+        
+        return solved_case_ids, downloaded_artifact_ids, total_points, case_titles
+    
+    @staticmethod
+    def _evaluate_time_condition(
         condition: ArtifactUnlockCondition,
+        now: datetime,
     ) -> Tuple[bool, Optional[str]]:
-        """Check if a single unlock condition is met."""
+        """Check a TIME_BASED condition (needs no user state)."""
+        if not condition.unlock_at:
+            return (True, None)
+        
+        if now >= condition.unlock_at:
+            return (True, None)
+        
+        return (False, f"This artifact unlocks at {condition.unlock_at.isoformat()}.")
+    
+    @staticmethod
+    def _pending_conditions(
+        conditions: Iterable[ArtifactUnlockCondition],
+        now: datetime,
+    ) -> List[ArtifactUnlockCondition]:
+        """Drop TIME_BASED conditions that are already satisfied."""
+        return [
+            c for c in conditions
+            if c.condition_type != UnlockConditionType.TIME_BASED
+            or not UnlockEngine._evaluate_time_condition(c, now)[0]
+        ]
+    
+    @staticmethod
+    def _evaluate_condition(
+        condition: ArtifactUnlockCondition,
+        solved_case_ids: Set[UUID],
+        downloaded_artifact_ids: Set[UUID],
+        total_points: int,
+        now: datetime,
+        case_titles: Optional[Dict[UUID, str]] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """Check if a single unlock condition is met against prefetched state."""
         
         if condition.condition_type == UnlockConditionType.CASE_SOLVED:
             if not condition.required_case_id:
                 return (True, None)  # Invalid condition, allow access
             
-            result = await db.execute(
-                select(Submission).where(
-                    Submission.user_id == user_id,
-                    Submission.case_id == condition.required_case_id,
-                    Submission.is_correct == True,
-                ).limit(1)
-            )
-            
-            if result.scalar_one_or_none():
+            if condition.required_case_id in solved_case_ids:
                 return (True, None)
             
-            # Get case title for reason
-            case_result = await db.execute(
-                select(Case.title).where(Case.id == condition.required_case_id)
-            )
-            case_title = case_result.scalar() or "the required case"
+            case_title = (case_titles or {}).get(condition.required_case_id) or "the required case"
             return (False, f"Solve '{case_title}' to unlock this artifact.")
         
         elif condition.condition_type == UnlockConditionType.ARTIFACT_DOWNLOADED:
             if not condition.required_artifact_id:
                 return (True, None)
             
-            result = await db.execute(
-                select(UserArtifactDownload).where(
-                    UserArtifactDownload.user_id == user_id,
-                    UserArtifactDownload.artifact_id == condition.required_artifact_id,
-                )
-            )
-            
-            if result.scalar_one_or_none():
+            if condition.required_artifact_id in downloaded_artifact_ids:
                 return (True, None)
             
             return (False, "Download a required artifact first to unlock this.")
         
         elif condition.condition_type == UnlockConditionType.TIME_BASED:
-            if not condition.unlock_at:
-                return (True, None)
-            
-            now = datetime.now(timezone.utc)
-            if now >= condition.unlock_at:
-                return (True, None)
-            
-            return (False, f"This artifact unlocks at {condition.unlock_at.isoformat()}.")
+            return UnlockEngine._evaluate_time_condition(condition, now)
         
         elif condition.condition_type == UnlockConditionType.POINTS_THRESHOLD:
             if not condition.required_points:
                 return (True, None)
             
-            # Calculate user's total points
-            result = await db.execute(
-                select(func.sum(Case.points)).select_from(
-                    Submission
-                ).join(
-                    Case, Submission.case_id == Case.id
-                ).where(
-                    Submission.user_id == user_id,
-                    Submission.is_correct == True,
-                )
-            )
-            total_points = result.scalar() or 0
-            
             if total_points >= condition.required_points:
                 return (True, None)
             
@@ -366,11 +574,11 @@ class UnlockEngine:
         
         return [
             {
-                "condition_id": str(c.id),
-                "condition_type": c.condition_type.value,
-                "required_case_id": str(c.required_case_id) if c.required_case_id else None,
-                "required_artifact_id": str(c.required_artifact_id) if c.required_artifact_id else None,
-                "unlock_at": c.unlock_at.isoformat() if c.unlock_at else None,
+                "condition_id": c.id,
+                "condition_type": c.condition_type,
+                "required_case_id": c.required_case_id,
+                "required_artifact_id": c.required_artifact_id,
+                "unlock_at": c.unlock_at,
                 "required_points": c.required_points,
                 "description": c.description,
             }
@@ -401,7 +609,6 @@ class UnlockEngine:
         
         db.add(condition)
         await db.flush()
-        await db.refresh(condition)
         
         return condition
     
@@ -454,15 +661,17 @@ class UnlockEngine:
         
         db.add(unlock)
         await db.flush()
-        await db.refresh(unlock)
         
-        # Fire telemetry hook
+        # Fire telemetry hook in the background (not needed for the grant),
+        # once the grant is committed and visible to the hook's own session
         if artifact_id:
-            await telemetry_service.on_artifact_unlocked(
-                db, user_id, artifact_id, case_id
-            )
+            run_after_commit(db, lambda: telemetry_service.schedule(
+                telemetry_service.on_artifact_unlocked, user_id, artifact_id, case_id
+            ))
         elif case_id:
-            await telemetry_service.on_case_unlocked(db, user_id, case_id)
+            run_after_commit(db, lambda: telemetry_service.schedule(
+                telemetry_service.on_case_unlocked, user_id, case_id
+            ))
         
         return unlock
     
@@ -497,12 +706,12 @@ class UnlockEngine:
         
         return [
             {
-                "unlock_id": str(u.id),
-                "artifact_id": str(u.artifact_id) if u.artifact_id else None,
-                "case_id": str(u.case_id) if u.case_id else None,
-                "granted_by": str(u.granted_by) if u.granted_by else None,
+                "unlock_id": u.id,
+                "artifact_id": u.artifact_id,
+                "case_id": u.case_id,
+                "granted_by": u.granted_by,
                 "reason": u.reason,
-                "created_at": u.created_at.isoformat() if u.created_at else None,
+                "created_at": u.created_at,
             }
             for u in unlocks
         ]
@@ -519,41 +728,72 @@ class UnlockEngine:
         
         Returns a list of cases with is_accessible and lock_reason fields.
         """
-        # Get all active cases
+        # Get all active cases (only the columns listed below)
         cases_result = await db.execute(
-            select(Case).where(Case.is_active == True).order_by(Case.created_at)
+            select(Case.id, Case.title, Case.slug, Case.difficulty, Case.points)
+            .where(Case.is_active == True)
+            .order_by(Case.created_at)
+        )
+        cases = cases_result.all()
+        
+        if not cases:
+            return []
+        
+        solved_case_ids = set(await db.scalars(
+            select(Submission.case_id).where(
+                Submission.user_id == user_id,
+                Submission.is_correct == True,
+            ).distinct()
+        ))
+        
+        access = await self.check_cases_accessible(
+            db, user_id, [case.id for case in cases]
         )
-        cases = list(cases_result.scalars().all())
         
         result = []
         for case in cases:
-            is_accessible, lock_reason = await self.check_case_accessible(
-                db, user_id, case.id
-            )
-            
-            # Check if user has solved this case
-            solved_result = await db.execute(
-                select(Submission).where(
-                    Submission.user_id == user_id,
-                    Submission.case_id == case.id,
-                    Submission.is_correct == True,
-                ).limit(1)
-            )
-            is_solved = solved_result.scalar_one_or_none() is not None
+            is_accessible, lock_reason = access[case.id]
             
             result.append({
-                "case_id": str(case.id),
+                "case_id": case.id,
                 "title": case.title,
                 "slug": case.slug,
                 "difficulty": case.difficulty.value,
                 "points": case.points,
                 "is_accessible": is_accessible,
-                "is_solved": is_solved,
+                "is_solved": case.id in solved_case_ids,
                 "lock_reason": lock_reason,
             })
         
         return result
     
+    @staticmethod
+    def _evaluate_case_dependencies(
+        dependencies: Iterable[tuple],
+        solved_case_ids: Set[UUID],
+        downloaded_artifact_ids: Set[UUID],
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Evaluate prefetched case dependencies without touching the database.
+        
+        Args:
+            dependencies: Iterable of (required_case_id, required_artifact_id,
+                lock_reason, required_case_title) tuples
+            solved_case_ids: Cases the user has solved
+            downloaded_artifact_ids: Artifacts the user has downloaded
+        
+        Returns:
+            Tuple of (is_accessible, lock_reason_if_locked)
+        """
+        for required_case_id, required_artifact_id, lock_reason, required_title in dependencies:
+            if required_case_id not in solved_case_ids:
+                return (False, lock_reason or f"You must solve '{required_title or 'another case'}' first.")
+            
+            if required_artifact_id and required_artifact_id not in downloaded_artifact_ids:
+                return (False, lock_reason or "You must download a required artifact first.")
+        
+        return (True, None)
+    
     async def get_case_artifact_access(
         self,
         db: AsyncSession,
@@ -563,9 +803,12 @@ class UnlockEngine:
         """
         Get all artifacts for a case with their accessibility status.
         """
+        # Shared across the case check and all artifact condition checks
+        subproblem_cache: Dict[tuple, Any] = {}
+        
         # First check if case itself is accessible
         case_accessible, case_lock_reason = await self.check_case_accessible(
-            db, user_id, case_id
+            db, user_id, case_id, subproblem_cache
         )
         
         if not case_accessible:
@@ -574,36 +817,95 @@ class UnlockEngine:
                 "lock_reason": case_lock_reason,
             }]
         
-        # Get artifacts for this case
+        # Get artifacts for this case (only the columns listed below)
         artifacts_result = await db.execute(
-            select(Artifact).where(Artifact.case_id == case_id)
+            select(
+                Artifact.id,
+                Artifact.name,
+                Artifact.description,
+                Artifact.artifact_type,
+                Artifact.file_size,
+            ).where(Artifact.case_id == case_id)
+        )
+        artifacts = artifacts_result.all()
+        
+        if not artifacts:
+            return []
+        
+        artifact_ids = [artifact.id for artifact in artifacts]
+        
+        # All unlock conditions for these artifacts in one query
+        conditions_result = await db.execute(
+            select(ArtifactUnlockCondition).where(
+                ArtifactUnlockCondition.artifact_id.in_(artifact_ids)
+            )
+        )
+        conditions_by_artifact: Dict[UUID, List[ArtifactUnlockCondition]] = {}
+        for condition in conditions_result.scalars().all():
+            conditions_by_artifact.setdefault(condition.artifact_id, []).append(condition)
+        
+        now = datetime.now(timezone.utc)
+        pending_conditions = {
+            artifact_id: self._pending_conditions(artifact_conditions, now)
+            for artifact_id, artifact_conditions in conditions_by_artifact.items()
+        }
+        conditions = [c for pending in pending_conditions.values() for c in pending]
+        required_artifact_ids = {c.required_artifact_id for c in conditions if c.required_artifact_id}
+        
+        # Download status for the listed artifacts and any artifact a condition requires
+        downloads_result = await db.execute(
+            select(
+                UserArtifactDownload.artifact_id,
+                UserArtifactDownload.download_count,
+            ).where(
+                UserArtifactDownload.user_id == user_id,
+                UserArtifactDownload.artifact_id.in_(set(artifact_ids) | required_artifact_ids),
+            )
+        )
+        download_counts: Dict[UUID, int] = dict(downloads_result.all())
+        
+        manual_artifact_ids = set(await db.scalars(
+            select(ManualUnlock.artifact_id).where(
+                ManualUnlock.user_id == user_id,
+                ManualUnlock.artifact_id.in_(artifact_ids),
+            )
+        ))
+        
+        solved_case_ids, downloaded_artifact_ids, total_points, case_titles = (
+            await self._prefetch_condition_state(
+                db, user_id, conditions, set(download_counts), subproblem_cache
+            )
         )
-        artifacts = list(artifacts_result.scalars().all())
         
         result = []
         for artifact in artifacts:
-            is_accessible, lock_reason = await self.check_artifact_accessible(
-                db, user_id, artifact.id
-            )
+            is_accessible, lock_reason = (True, None)
+            if artifact.id not in manual_artifact_ids:
+                for condition in pending_conditions.get(artifact.id, ()):
+                    is_met, reason = self._evaluate_condition(
+                        condition,
+                        solved_case_ids,
+                        downloaded_artifact_ids,
+                        total_points,
+                        now,
+                        case_titles,
+                    )
+                    if not is_met:
+                        is_accessible = False
+                        lock_reason = reason or condition.description or "Artifact is locked."
+                        break
             
-            # Check if user has downloaded this artifact
-            download_result = await db.execute(
-                select(UserArtifactDownload).where(
-                    UserArtifactDownload.user_id == user_id,
-                    UserArtifactDownload.artifact_id == artifact.id,
-                )
-            )
-            download = download_result.scalar_one_or_none()
+            download_count = download_counts.get(artifact.id)
             
             result.append({
-                "artifact_id": str(artifact.id),
+                "artifact_id": artifact.id,
                 "name": artifact.name,
                 "description": artifact.description,
                 "artifact_type": artifact.artifact_type.value,
                 "file_size": artifact.file_size,
                 "is_accessible": is_accessible,
-                "is_downloaded": download is not None,
-                "download_count": download.download_count if download else 0,
+                "is_downloaded": download_count is not None,
+                "download_count": download_count or 0,
                 "lock_reason": lock_reason,
             })
         
@@ -2,18 +2,52 @@
 User Service - Business logic for user management.
 """
 
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func, or_, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.config import settings
 from ..core.security import security_service
-from ..db.models import User, InviteCode, Submission, Case
+from ..db.models import User, InviteCode, Submission, Case, UserStats
 from ..schemas.user import UserCreate
 
 
+# Argon2 work runs off the event loop on its own small pool. Each hash/verify
+# allocates ARGON2_MEMORY_COST, so the pool size caps memory under a login or
+# registration flood (the default executor would allow up to 32 at once).
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="argon2",
+)
+
+
+def shutdown_password_executor() -> None:
+    """Shut down the Argon2 thread pool (call on shutdown)."""
+    _password_executor.shutdown(wait=False, cancel_futures=True)
+
+
+@functools.cache
+def _dummy_password_hash() -> str:
+    """Hash computed on first use rather than at import (Argon2 is slow)."""
+    return security_service.hash_password("dummy_password_for_timing")
+
+
+def _verify_dummy_password(password: str) -> bool:
+    """
+    Verify against the dummy hash when the email is unknown, so a missing
+    user costs the same as a wrong password (hashing would be noticeably
+    slower than verifying).
+    """
+    return security_service.verify_password(password, _dummy_password_hash())
+
+
 class UserService:
     """
     Service for user management operations.
@@ -39,20 +73,19 @@ class UserService:
         Returns:
             Tuple of (User or None, error message or empty string)
         """
-        # Check if email already exists
-        email_exists = await db.execute(
-            select(User).where(User.email == user_data.email).limit(1)
-        )
-        if email_exists.scalar_one_or_none():
-            # Generic message to prevent email enumeration
-            return None, "Registration failed. Please check your details."
-        
-        # Check if username already exists
-        username_exists = await db.execute(
-            select(User).where(User.username == user_data.username.lower()).limit(1)
+        # Check email and username uniqueness in one query
+        already_registered = await db.scalar(
+            select(
+                exists().where(
+                    or_(
+                        User.email == user_data.email,
+                        User.username == user_data.username.lower(),
+                    )
+                )
+            )
         )
-        if username_exists.scalar_one_or_none():
-            # Generic message to prevent username enumeration
+        if already_registered:
+            # Generic message to prevent email/username enumeration
             return None, "Registration failed. Please check your details."
         
         # Validate invite code
@@ -67,8 +100,10 @@ class UserService:
         if not invite_code.is_valid:
             return None, "Invite code has expired or been used"
         
-        # Hash the password
-        password_hash = security_service.hash_password(user_data.password)
+        # Hash the password (CPU-bound, keep it off the event loop)
+        password_hash = await asyncio.get_running_loop().run_in_executor(
+            _password_executor, security_service.hash_password, user_data.password
+        )
         
         # Create user
         user = User(
@@ -79,19 +114,19 @@ class UserService:
             is_active=True,
             is_admin=False,
         )
-        
         db.add(user)
-        await db.flush()
         
         # Mark invite code as used
         invite_code.use_count += 1
         if invite_code.use_count >= invite_code.max_uses:
             invite_code.is_used = True
-        invite_code.used_by_id = user.id
+        invite_code.used_by = user
         invite_code.used_at = datetime.now(timezone.utc)
         
+        # Single flush for both writes (the used_by relationship orders the
+        # user INSERT first); all defaults are client-side so no refresh
+        # is needed
         await db.flush()
-        await db.refresh(user)
         
         return user, ""
     
@@ -117,20 +152,29 @@ class UserService:
         )
         user = result.scalar_one_or_none()
         
+        # Argon2 work runs on the password pool so it doesn't block other
+        # requests on this worker
+        loop = asyncio.get_running_loop()
+        
         if not user:
-            # Perform a dummy hash to prevent timing attacks
-            security_service.hash_password("dummy_password_for_timing")
+            # Perform a dummy verify to prevent timing attacks
+            await loop.run_in_executor(_password_executor, _verify_dummy_password, password)
             return None, "Invalid email or password"
         
         if not user.is_active:
             return None, "Account is deactivated"
         
-        if not security_service.verify_password(password, user.password_hash):
+        password_ok = await loop.run_in_executor(
+            _password_executor, security_service.verify_password, password, user.password_hash
+        )
+        if not password_ok:
             return None, "Invalid email or password"
         
         # Check if password needs rehashing (parameters changed)
         if security_service.needs_rehash(user.password_hash):
-            user.password_hash = security_service.hash_password(password)
+            user.password_hash = await loop.run_in_executor(
+                _password_executor, security_service.hash_password, password
+            )
             await db.flush()
         
         return user, ""
@@ -161,64 +205,144 @@ class UserService:
         Returns:
             Dictionary with user statistics.
         """
-        # Total submissions
-        total_submissions_result = await db.execute(
-            select(func.count(Submission.id))
+        # Submission counts in a single pass over the user's submissions
+        counts_result = await db.execute(
+            select(
+                func.count(Submission.id),
+                func.count(Submission.id).filter(Submission.is_correct == True),
+                func.count(func.distinct(Submission.case_id)),
+                func.count(func.distinct(Submission.case_id)).filter(
+                    Submission.is_correct == True
+                ),
+            )
             .where(Submission.user_id == user_id)
         )
-        total_submissions = total_submissions_result.scalar() or 0
+        (
+            total_submissions,
+            correct_submissions,
+            cases_attempted,
+            cases_solved,
+        ) = counts_result.one()
         
-        # Correct submissions
-        correct_submissions_result = await db.execute(
-            select(func.count(Submission.id))
+        # Total points (each solved case counts once, however many correct
+        # submissions it has)
+        total_points = (await db.execute(self._solved_points_query(user_id))).scalar()
+        
+        return {
+            "total_submissions": total_submissions,
+            "correct_submissions": correct_submissions,
+            "unique_cases_attempted": cases_attempted,
+            "unique_cases_solved": cases_solved,
+            "total_points": total_points,
+            "success_rate": round(
+                (correct_submissions / total_submissions * 100) if total_submissions > 0 else 0.0,
+                2,
+            ),
+        }
+    
+    @staticmethod
+    def _solved_points_query(user_id: UUID):
+        """SELECT of a user's total points over distinct solved cases."""
+        solved_cases = (
+            select(Case.id, Case.points)
+            .join(Submission, Submission.case_id == Case.id)
             .where(
                 Submission.user_id == user_id,
                 Submission.is_correct == True,
             )
+            .distinct()
+            .subquery()
         )
-        correct_submissions = correct_submissions_result.scalar() or 0
+        return select(func.coalesce(func.sum(solved_cases.c.points), 0))
+    
+    async def lock_user_stats(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+    ) -> None:
+        """
+        Lock the user's stats row until the transaction ends, creating it if needed.
         
-        # Unique cases attempted
-        cases_attempted_result = await db.execute(
-            select(func.count(func.distinct(Submission.case_id)))
-            .where(Submission.user_id == user_id)
+        Serializes a user's first-solve checks so the same case can't be
+        counted twice by concurrent submissions.
+        
+        Args:
+            db: Database session.
+            user_id: The user ID.
+        """
+        await db.execute(
+            pg_insert(UserStats)
+            .values(user_id=user_id, total_points=0)
+            .on_conflict_do_nothing(index_elements=[UserStats.user_id])
+        )
+        await db.execute(
+            select(UserStats.user_id)
+            .where(UserStats.user_id == user_id)
+            .with_for_update()
         )
-        cases_attempted = cases_attempted_result.scalar() or 0
+    
+    async def add_solve_points(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        points: int,
+    ) -> None:
+        """
+        Add a newly solved case's points to the user's stored total.
         
-        # Unique cases solved
-        cases_solved_result = await db.execute(
-            select(func.count(func.distinct(Submission.case_id)))
-            .where(
-                Submission.user_id == user_id,
-                Submission.is_correct == True,
+        The increment happens in SQL under the row lock, so concurrent first
+        solves of different cases both count. Call lock_user_stats before
+        deciding the solve is a first one.
+        
+        Args:
+            db: Database session.
+            user_id: The user ID.
+            points: Points of the solved case.
+        """
+        await db.execute(
+            pg_insert(UserStats)
+            .values(user_id=user_id, total_points=points)
+            .on_conflict_do_update(
+                index_elements=[UserStats.user_id],
+                set_={
+                    "total_points": UserStats.total_points + points,
+                    "updated_at": func.now(),
+                },
             )
         )
-        cases_solved = cases_solved_result.scalar() or 0
+    
+    async def adjust_points_for_case(
+        self,
+        db: AsyncSession,
+        case_id: UUID,
+        delta: int,
+    ) -> None:
+        """
+        Shift the stored total points of everyone who solved a case.
         
-        # Total points
-        # Need to get points from solved cases (only counting first solve)
-        solved_cases_result = await db.execute(
-            select(Case.points)
-            .join(Submission, Submission.case_id == Case.id)
+        Used when a case's points change or the case is deleted.
+        
+        Args:
+            db: Database session.
+            case_id: The case ID.
+            delta: Points to add (negative to subtract).
+        """
+        if not delta:
+            return
+        
+        solvers = (
+            select(Submission.user_id)
             .where(
-                Submission.user_id == user_id,
+                Submission.case_id == case_id,
                 Submission.is_correct == True,
             )
-            .distinct(Submission.case_id)
+            .distinct()
+        )
+        await db.execute(
+            update(UserStats)
+            .where(UserStats.user_id.in_(solvers))
+            .values(total_points=UserStats.total_points + delta)
         )
-        total_points = sum(row[0] for row in solved_cases_result.fetchall())
-        
-        return {
-            "total_submissions": total_submissions,
-            "correct_submissions": correct_submissions,
-            "unique_cases_attempted": cases_attempted,
-            "unique_cases_solved": cases_solved,
-            "total_points": total_points,
-            "success_rate": round(
-                (correct_submissions / total_submissions * 100) if total_submissions > 0 else 0.0,
-                2,
-            ),
-        }
 
 
 # Global user service instance
@@ -1,19 +1,23 @@
 """
-Rate Limiter - In-memory rate limiting with sliding window.
+Rate Limiter - In-memory rate limiting with a sliding window counter.
 
 For production, this should be replaced with Redis-based rate limiting.
 This implementation is suitable for single-instance deployments.
 """
 
 import asyncio
-from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+import time
+from collections import OrderedDict
+from typing import Tuple
 
 
 class RateLimiter:
     """
-    In-memory rate limiter using sliding window algorithm.
+    In-memory rate limiter using a sliding window counter.
+    
+    Each key keeps only the request counts of the current and previous
+    fixed windows; the sliding-window count is approximated by weighting
+    the previous window by how much of it still overlaps the sliding one.
     
     For production deployments with multiple instances,
     replace this with a Redis-based implementation.
@@ -23,21 +27,51 @@ class RateLimiter:
         self,
         requests_per_minute: int = 10,
         key_prefix: str = "default",
+        max_keys: int = 100_000,
     ):
         """
         Initialize the rate limiter.
         
         Args:
             requests_per_minute: Maximum requests allowed per minute.
-            key_prefix: Prefix for rate limit keys.
+            key_prefix: Name of this limiter (a Redis-backed implementation
+                would prefix its keys with it; here each limiter already has
+                its own storage, so keys are used as-is).
+            max_keys: Maximum number of keys tracked at once. Idle keys are
+                evicted to make room; requests for new keys are rejected
+                while every tracked key still counts towards its limit.
         """
         self.requests_per_minute = requests_per_minute
         self.key_prefix = key_prefix
         self.window_size = 60  # seconds
+        self.max_keys = max_keys
         
-        # Storage: key -> list of timestamps
-        self._requests: Dict[str, List[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # Storage: key -> (window index, current window count, previous window count)
+        # No lock: none of the methods await while touching this dict, so
+        # each update runs atomically on the event loop.
+        # Kept in least-recently-used order, so idle keys are always at the
+        # front and can be evicted without scanning the whole dict.
+        self._counters: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+    
+    def _current_counts(self, key: str, now: float) -> Tuple[int, int, int, float]:
+        """
+        Roll a key's counters forward to the window containing `now`.
+        
+        Returns:
+            Tuple of (window index, current count, previous count, estimated
+            number of requests in the sliding window ending at `now`)
+        """
+        window = int(now // self.window_size)
+        stored_window, current, previous = self._counters.get(key, (window, 0, 0))
+        
+        if stored_window == window - 1:
+            previous, current = current, 0
+        elif stored_window != window:
+            previous, current = 0, 0
+        
+        elapsed = now - window * self.window_size
+        estimate = previous * (1 - elapsed / self.window_size) + current
+        return window, current, previous, estimate
     
     async def is_allowed(self, key: str) -> bool:
         """
@@ -49,24 +83,54 @@ class RateLimiter:
         Returns:
             True if the request is allowed, False otherwise.
         """
-        full_key = f"{self.key_prefix}:{key}"
-        now = datetime.now(timezone.utc).timestamp()
-        window_start = now - self.window_size
+        now = time.monotonic()
         
-        async with self._lock:
-            # Clean up old requests outside the window
-            self._requests[full_key] = [
-                ts for ts in self._requests[full_key]
-                if ts > window_start
-            ]
-            
-            # Check if under limit
-            if len(self._requests[full_key]) >= self.requests_per_minute:
-                return False
-            
-            # Add current request
-            self._requests[full_key].append(now)
+        window, current, previous, estimate = self._current_counts(key, now)
+        
+        # Check if under limit (counting this request)
+        allowed = estimate + 1 <= self.requests_per_minute
+        if allowed:
+            # Count current request
+            current += 1
+        
+        # A new key that can't be tracked is rejected rather than let through
+        # uncounted
+        stored = self._store(key, (window, current, previous))
+        return allowed and stored
+    
+    def _store(self, key: str, counts: Tuple[int, int, int]) -> bool:
+        """
+        Store a key's counters as most recently used.
+        
+        Returns:
+            False if the key is new and there is no room for it, even after
+            evicting idle keys.
+        """
+        if key in self._counters:
+            self._counters.move_to_end(key)
+            self._counters[key] = counts
             return True
+        
+        if len(self._counters) >= self.max_keys:
+            self._evict_idle(counts[0])
+            if len(self._counters) >= self.max_keys:
+                return False
+        
+        self._counters[key] = counts
+        return True
+    
+    def _evict_idle(self, window: int) -> None:
+        """
+        Evict keys untouched for two windows, oldest first.
+        
+        Live counters are never evicted, so a burst of unique keys can't
+        reset another key's limit.
+        """
+        while self._counters:
+            key, (stored_window, _, _) = next(iter(self._counters.items()))
+            if stored_window >= window - 1:
+                break  # Every key after this one was touched more recently
+            del self._counters[key]
     
     async def get_remaining(self, key: str) -> Tuple[int, float]:
         """
@@ -76,29 +140,20 @@ class RateLimiter:
             key: The rate limit key.
         
         Returns:
-            Tuple of (remaining requests, seconds until oldest expires)
-        """
-        full_key = f"{self.key_prefix}:{key}"
-        now = datetime.now(timezone.utc).timestamp()
-        window_start = now - self.window_size
-        
-        async with self._lock:
-            # Clean up old requests
-            self._requests[full_key] = [
-                ts for ts in self._requests[full_key]
-                if ts > window_start
-            ]
-            
-            current_count = len(self._requests[full_key])
-            remaining = max(0, self.requests_per_minute - current_count)
-            
-            if self._requests[full_key]:
-                oldest = min(self._requests[full_key])
-                reset_in = max(0, oldest + self.window_size - now)
-            else:
-                reset_in = 0.0
-            
-            return remaining, reset_in
+            Tuple of (remaining requests, seconds until the current window ends)
+        """
+        now = time.monotonic()
+        
+        window, current, previous, estimate = self._current_counts(key, now)
+        
+        remaining = max(0, int(self.requests_per_minute - estimate))
+        
+        if current or previous:
+            reset_in = max(0.0, (window + 1) * self.window_size - now)
+        else:
+            reset_in = 0.0
+        
+        return remaining, reset_in
     
     async def reset(self, key: str) -> None:
         """
@@ -107,38 +162,39 @@ class RateLimiter:
         Args:
             key: The rate limit key.
         """
-        full_key = f"{self.key_prefix}:{key}"
-        async with self._lock:
-            self._requests.pop(full_key, None)
+        self._counters.pop(key, None)
     
-    async def cleanup(self) -> int:
+    async def cleanup(self, batch_size: int = 1000) -> int:
         """
         Clean up expired entries from all keys.
         
+        Keys are checked in batches, yielding to the event loop between
+        batches so a large sweep doesn't stall request handling.
+        
+        Args:
+            batch_size: Number of keys checked before yielding.
+        
         Returns:
             Number of keys cleaned up.
         """
-        now = datetime.now(timezone.utc).timestamp()
-        window_start = now - self.window_size
-        cleaned = 0
+        keys = list(self._counters)
+        removed = 0
         
-        async with self._lock:
-            keys_to_remove = []
+        for start in range(0, len(keys), batch_size):
+            window = int(time.monotonic() // self.window_size)
             
-            for key, timestamps in self._requests.items():
-                # Filter out expired timestamps
-                valid = [ts for ts in timestamps if ts > window_start]
+            for key in keys[start:start + batch_size]:
+                # The key may have been touched or evicted since the snapshot
+                counts = self._counters.get(key)
                 
-                if not valid:
-                    keys_to_remove.append(key)
-                    cleaned += 1
-                else:
-                    self._requests[key] = valid
+                # Keys untouched for two windows no longer count towards any limit
+                if counts is not None and counts[0] < window - 1:
+                    del self._counters[key]
+                    removed += 1
             
-            for key in keys_to_remove:
-                del self._requests[key]
+            await asyncio.sleep(0)
         
-        return cleaned
+        return removed
 
 
 # Background task to periodically clean up expired entries
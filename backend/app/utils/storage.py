@@ -2,9 +2,12 @@
 Storage Client - S3-compatible storage (MinIO) client for artifact management.
 """
 
+import asyncio
+import functools
 import hashlib
 import io
-from typing import Optional, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, BinaryIO
 from datetime import timedelta
 
 from minio import Minio
@@ -13,6 +16,10 @@ from minio.error import S3Error
 from ..core.config import settings
 
 
+# Multipart chunk size for streamed uploads (S3 requires at least 5 MiB)
+UPLOAD_PART_SIZE = 10 * 1024 * 1024
+
+
 class StorageClient:
     """
     S3-compatible storage client for managing forensic artifacts.
@@ -58,6 +65,13 @@ class StorageClient:
         
         self._client: Optional[Minio] = None
         self._public_client: Optional[Minio] = None
+        
+        # The MinIO SDK is blocking; its calls run on this pool so a slow
+        # round-trip doesn't stall the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=32,
+            thread_name_prefix="storage",
+        )
     
     @property
     def client(self) -> Minio:
@@ -83,13 +97,23 @@ class StorageClient:
             )
         return self._public_client
     
+    def close(self) -> None:
+        """Shut down the storage thread pool (call on shutdown)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking storage call on the storage thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+    
     async def ensure_bucket_exists(self) -> None:
         """
         Ensure the default bucket exists, create if not.
         """
         try:
-            if not self.client.bucket_exists(self.bucket_name):
-                self.client.make_bucket(self.bucket_name)
+            if not await self._run(self.client.bucket_exists, self.bucket_name):
+                await self._run(self.client.make_bucket, self.bucket_name)
         except S3Error as e:
             raise StorageError(f"Failed to ensure bucket exists: {e}")
     
@@ -113,16 +137,15 @@ class StorageClient:
             The storage path of the uploaded file.
         """
         try:
-            # Get file size
-            file_data.seek(0, 2)  # Seek to end
-            file_size = file_data.tell()
-            file_data.seek(0)  # Seek back to start
-            
-            self.client.put_object(
+            # Stream as a multipart upload of unknown length, so only one
+            # part is buffered at a time
+            await self._run(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 data=file_data,
-                length=file_size,
+                length=-1,
+                part_size=UPLOAD_PART_SIZE,
                 content_type=content_type or "application/octet-stream",
                 metadata=metadata,
             )
@@ -146,13 +169,18 @@ class StorageClient:
             File contents as bytes.
         """
         try:
-            response = self.client.get_object(
-                bucket_name=self.bucket_name,
-                object_name=object_name,
-            )
-            return response.read()
+            return await self._run(self._read_object, object_name)
         except S3Error as e:
             raise StorageError(f"Failed to download file: {e}")
+    
+    def _read_object(self, object_name: str) -> bytes:
+        """Read a whole object and release its connection (blocking)."""
+        response = self.client.get_object(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+        )
+        try:
+            return response.read()
         finally:
             response.close()
             response.release_conn()
@@ -174,7 +202,8 @@ class StorageClient:
         """
         try:
             # Generate URL using internal client (which can reach MinIO)
-            url = self.client.presigned_get_object(
+            url = await self._run(
+                self.client.presigned_get_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 expires=expires,
@@ -202,7 +231,8 @@ class StorageClient:
             Presigned upload URL.
         """
         try:
-            return self.client.presigned_put_object(
+            return await self._run(
+                self.client.presigned_put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 expires=expires,
@@ -218,7 +248,8 @@ class StorageClient:
             object_name: Name/path of the object to delete.
         """
         try:
-            self.client.remove_object(
+            await self._run(
+                self.client.remove_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
             )
@@ -236,7 +267,8 @@ class StorageClient:
             True if the file exists, False otherwise.
         """
         try:
-            self.client.stat_object(
+            await self._run(
+                self.client.stat_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
             )
@@ -255,11 +287,10 @@ class StorageClient:
         Returns:
             Hex-encoded SHA-256 hash.
         """
-        sha256_hash = hashlib.sha256()
         file_data.seek(0)
         
-        for chunk in iter(lambda: file_data.read(8192), b""):
-            sha256_hash.update(chunk)
+        # Reads and hashes in C with a large buffer, releasing the GIL
+        sha256_hash = hashlib.file_digest(file_data, "sha256")
         
         file_data.seek(0)
         return sha256_hash.hexdigest()
@@ -12,13 +12,15 @@ Key Features:
 """
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Tuple
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.middleware import (
@@ -29,6 +31,8 @@ from app.core.middleware import (
 from app.api.v1 import api_router
 from app.db.session import init_db, close_db, engine
 from app.utils.storage import storage_client
+from app.services.telemetry_service import telemetry_service
+from app.services.user_service import shutdown_password_executor
 
 
 @asynccontextmanager
@@ -60,6 +64,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     # Shutdown
     print("Shutting down...")
+    await telemetry_service.drain()
+    storage_client.close()
+    shutdown_password_executor()
     await close_db()
     print("Database connections closed")
 
@@ -108,6 +115,7 @@ Good luck, investigator.
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     openapi_url="/openapi.json" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -136,15 +144,15 @@ app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with clean error messages."""
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"][1:])  # Skip 'body'
-        errors.append({
-            "field": field,
+    errors = [
+        {
+            "field": ".".join(map(str, error["loc"][1:])),  # Skip 'body'
             "message": error["msg"],
-        })
+        }
+        for error in exc.errors()
+    ]
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
@@ -159,7 +167,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     if settings.DEBUG:
         raise exc
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"},
     )
@@ -175,11 +183,21 @@ async def health_check():
     }
 
 
+# Last successful readiness result, so frequent probes don't each hit the DB
+_READY_TTL = 2.0  # seconds
+_ready_cache: Optional[Tuple[float, dict]] = None
+
+
 @app.get("/health/ready", tags=["Health"])
 async def readiness_check():
     """
     Readiness check - verifies all dependencies are available.
     """
+    global _ready_cache
+    
+    if _ready_cache is not None and time.monotonic() - _ready_cache[0] < _READY_TTL:
+        return dict(_ready_cache[1])
+    
     status_response = {
         "status": "ready",
         "version": settings.APP_VERSION,
@@ -190,7 +208,7 @@ async def readiness_check():
     # Check database
     try:
         async with engine.connect() as conn:
-            await conn.execute("SELECT 1")
+            await conn.execute(text("SELECT 1"))
         status_response["database"] = "connected"
     except Exception as e:
         status_response["database"] = f"error: {str(e)}"
@@ -205,6 +223,10 @@ async def readiness_check():
         status_response["storage"] = f"error: {str(e)}"
         status_response["status"] = "not ready"
     
+    # Failures are never cached so recovery is picked up immediately
+    if status_response["status"] == "ready":
+        _ready_cache = (time.monotonic(), dict(status_response))
+    
     return status_response
 
 
@@ -14,7 +14,7 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from app.core.security import security_service
 from app.db.session import SessionLocal
 from app.db.models import User, InviteCode
@@ -28,14 +28,13 @@ async def create_admin():
     print("=" * 50)
     
     async with SessionLocal() as db:
-        # Check if any admin exists
-        result = await db.execute(
-            select(User).where(User.is_admin == True).limit(1)
+        # Check if any admin exists (email only - no need to load the user)
+        existing_admin_email = await db.scalar(
+            select(User.email).where(User.is_admin == True).limit(1)
         )
-        existing_admin = result.scalar_one_or_none()
         
-        if existing_admin:
-            print(f"\n⚠️  Admin user already exists: {existing_admin.email}")
+        if existing_admin_email is not None:
+            print(f"\n⚠️  Admin user already exists: {existing_admin_email}")
             print("If you need to create another admin, modify this script.")
             return
         
@@ -106,26 +105,25 @@ async def generate_invite_codes(count: int = 5):
     print("=" * 50)
     
     async with SessionLocal() as db:
-        # Get admin user
-        result = await db.execute(
-            select(User).where(User.is_admin == True).limit(1)
+        # Get admin user id
+        admin_id = await db.scalar(
+            select(User.id).where(User.is_admin == True).limit(1)
         )
-        admin = result.scalar_one_or_none()
         
-        if not admin:
+        if admin_id is None:
             print("❌ No admin user found. Run create_admin first.")
             return
         
-        codes = []
-        for _ in range(count):
-            code_str = security_service.generate_invite_code()
-            invite_code = InviteCode(
-                code=code_str,
-                max_uses=1,
-                created_by_id=admin.id,
-            )
-            db.add(invite_code)
-            codes.append(code_str)
+        codes = security_service.generate_invite_codes_bulk(count)
+        
+        # Bulk INSERT - the rows are never read back, so skip ORM objects
+        await db.execute(
+            insert(InviteCode),
+            [
+                {"code": code_str, "max_uses": 1, "created_by_id": admin_id}
+                for code_str in codes
+            ],
+        )
         
         await db.commit()
         
@@ -7,34 +7,38 @@ import uuid
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import text
-from argon2 import PasswordHasher
+from app.core.password_hasher import low_memory_hasher
 from app.db.session import get_sync_session
 
 
+# Statements are built once so SQLAlchemy's compiled cache can reuse them.
+# invite_codes is truncated (nothing references it); users is DELETEd rather
+# than truncated, because TRUNCATE ... CASCADE would also empty tables that
+# only SET NULL their user reference (e.g. telemetry_events).
+CLEAR_INVITE_CODES_SQL = text("TRUNCATE invite_codes")
+CLEAR_USERS_SQL = text("DELETE FROM users")
+INSERT_ADMIN_SQL = text("""
+    INSERT INTO users (id, email, username, password_hash, is_active, is_admin, invite_code_used, flag_salt, flag_salt_rotated_at, created_at, updated_at)
+    VALUES (:id, :email, :username, :password_hash, true, true, 'ADMIN_DIRECT', :flag_salt, NOW(), NOW(), NOW())
+""")
+
+
 def create_admin(email: str, password: str, username: str = "admin"):
     """Create admin user with provided credentials."""
     
-    # Use lighter Argon2 settings for low-memory environments
-    hasher = PasswordHasher(
-        time_cost=2,
-        memory_cost=16384,  # 16 MB instead of 64 MB
-        parallelism=1,
-        hash_len=32,
-        salt_len=16,
-    )
+    # Hash before opening the session so the transaction stays short
+    password_hash = low_memory_hasher.hash(password)
+    print("Password hashed successfully")
     
     session = get_sync_session()
     
     try:
-        # Delete in correct order due to foreign key constraints
-        session.execute(text("DELETE FROM invite_codes"))
-        session.execute(text("DELETE FROM users"))
-        session.commit()
+        # Invite codes reference users, so clear them first. Everything
+        # commits together, so a failure below keeps the existing users.
+        session.execute(CLEAR_INVITE_CODES_SQL)
+        session.execute(CLEAR_USERS_SQL)
         print("Deleted all existing users and invite codes")
         
-        password_hash = hasher.hash(password)
-        print("Password hashed successfully")
-        
         # Generate UUID for user
         user_id = str(uuid.uuid4())
         
@@ -43,10 +47,7 @@ def create_admin(email: str, password: str, username: str = "admin"):
         flag_salt = secrets.token_hex(32)
         
         # Insert admin user
-        session.execute(text("""
-            INSERT INTO users (id, email, username, password_hash, is_active, is_admin, invite_code_used, flag_salt, flag_salt_rotated_at, created_at, updated_at)
-            VALUES (:id, :email, :username, :password_hash, true, true, 'ADMIN_DIRECT', :flag_salt, NOW(), NOW(), NOW())
-        """), {
+        session.execute(INSERT_ADMIN_SQL, {
             "id": user_id,
             "email": email,
             "username": username,
@@ -19,12 +19,20 @@ def fix_difficulty():
         enum_vals = [row[0] for row in result]
         print(f"PostgreSQL enum values: {enum_vals}")
         
-        # Check current values
-        result = session.execute(text("SELECT id, title, difficulty FROM cases"))
-        rows = result.fetchall()
-        print("\nCurrent cases:")
-        for row in rows:
-            print(f"  {row}")
+        # Check current values, aggregated in the database
+        result = session.execute(text("""
+            SELECT difficulty, COUNT(*) FROM cases GROUP BY difficulty ORDER BY difficulty
+        """))
+        print("\nCases per difficulty:")
+        for difficulty, count in result:
+            print(f"  {difficulty}: {count}")
+        
+        # Full row listing only on request (VERBOSE=1)
+        if os.getenv("VERBOSE"):
+            result = session.execute(text("SELECT id, title, difficulty FROM cases"))
+            print("\nCurrent cases:")
+            for row in result:
+                print(f"  {row}")
         
         # Check what the Python enum expects
         from app.db.models import DifficultyLevel
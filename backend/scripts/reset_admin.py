@@ -1,83 +1,66 @@
 """Reset/create admin with valid email."""
 
 import asyncio
+import secrets
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select, update
+from sqlalchemy import text
 from app.core.security import security_service
 from app.db.session import SessionLocal
-from app.db.models import User, InviteCode
+
+
+# Update the first admin if there is one, otherwise create the admin together
+# with its (already used) invite code. Data-modifying CTEs all run, so this is
+# a single round trip for either branch.
+UPSERT_ADMIN_SQL = text("""
+    WITH updated AS (
+        UPDATE users
+        SET email = :email, password_hash = :password_hash, updated_at = NOW()
+        WHERE id = (SELECT id FROM users WHERE is_admin = true LIMIT 1)
+        RETURNING id
+    ),
+    inserted AS (
+        INSERT INTO users (id, email, username, password_hash, invite_code_used, is_active, is_admin, flag_salt, flag_salt_rotated_at, created_at, updated_at)
+        SELECT gen_random_uuid(), :email, :username, :password_hash, :invite_code, true, true, :flag_salt, NOW(), NOW(), NOW()
+        WHERE NOT EXISTS (SELECT 1 FROM updated)
+        RETURNING id
+    ),
+    invite AS (
+        INSERT INTO invite_codes (id, code, max_uses, use_count, is_used, used_by_id, created_at, updated_at)
+        SELECT gen_random_uuid(), :invite_code, 1, 1, true, id, NOW(), NOW()
+        FROM inserted
+    )
+    SELECT EXISTS (SELECT 1 FROM inserted)
+""")
 
 
 async def reset_admin():
     """Update admin user with valid email."""
     
+    email = "admin@forensic-ctf.com"
+    username = "admin"
+    password = "adminpassword123!"
+    password_hash = security_service.hash_password(password)
+    
     async with SessionLocal() as db:
-        # Get existing admin
-        result = await db.execute(
-            select(User).where(User.is_admin == True).limit(1)
-        )
-        admin = result.scalar_one_or_none()
-        
-        if admin:
-            # Update existing admin
-            new_email = "admin@forensic-ctf.com"
-            new_password = "adminpassword123!"
-            password_hash = security_service.hash_password(new_password)
-            
-            admin.email = new_email
-            admin.password_hash = password_hash
-            
-            await db.commit()
-            
-            print("=" * 50)
-            print("Admin user updated!")
-            print("=" * 50)
-            print(f"Email: {new_email}")
-            print(f"Password: {new_password}")
-            print("=" * 50)
-        else:
-            # Create new admin
-            admin_invite_code = security_service.generate_invite_code()
-            invite_code = InviteCode(
-                code=admin_invite_code,
-                max_uses=1,
-                use_count=1,
-                is_used=True,
-            )
-            db.add(invite_code)
-            await db.flush()
-            
-            email = "admin@forensic-ctf.com"
-            username = "admin"
-            password = "adminpassword123!"
-            
-            password_hash = security_service.hash_password(password)
-            
-            admin_user = User(
-                email=email,
-                username=username,
-                password_hash=password_hash,
-                invite_code_used=admin_invite_code,
-                is_active=True,
-                is_admin=True,
-            )
-            
-            db.add(admin_user)
-            await db.flush()
-            
-            invite_code.used_by_id = admin_user.id
-            await db.commit()
-            
-            print("=" * 50)
-            print("Admin user created!")
-            print("=" * 50)
-            print(f"Email: {email}")
-            print(f"Password: {password}")
-            print("=" * 50)
+        created = await db.scalar(UPSERT_ADMIN_SQL, {
+            "email": email,
+            "username": username,
+            "password_hash": password_hash,
+            "invite_code": security_service.generate_invite_code(),
+            "flag_salt": secrets.token_hex(32),
+        })
+        await db.commit()
+    
+    print("=" * 50)
+    print("Admin user created!" if created else "Admin user updated!")
+    print("=" * 50)
+    print(f"Email: {email}")
+    print(f"Password: {password}")
+    print("=" * 50)
 
 
 if __name__ == "__main__":
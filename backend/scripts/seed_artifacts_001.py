@@ -8,7 +8,7 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select
+from sqlalchemy import select, insert, text
 from app.db.session import SessionLocal
 from app.db.models import Case, Artifact, ArtifactType
 
@@ -17,6 +17,10 @@ async def seed_artifacts():
     """Seed artifacts for Case 001."""
     
     async with SessionLocal() as db:
+        # One transaction for the whole run; the script is safe to re-run,
+        # so don't wait for the WAL flush on commit
+        await db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        
         # Get Case 001
         result = await db.execute(
             select(Case).where(Case.slug == "the-disappearance")
@@ -88,12 +92,11 @@ async def seed_artifacts():
             },
         ]
         
-        for art_data in artifacts_data:
-            artifact = Artifact(
-                case_id=case.id,
-                **art_data
-            )
-            db.add(artifact)
+        # One multi-row INSERT for all artifacts
+        await db.execute(
+            insert(Artifact),
+            [{"case_id": case.id, **art_data} for art_data in artifacts_data],
+        )
         
         await db.commit()
         
@@ -10,11 +10,16 @@ import secrets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from app.db.session import SessionLocal
 from app.db.models import Case, DifficultyLevel
 
 
+# The semantic truth (the answer) and its stored hash, computed once
+SEMANTIC_TRUTH = "d4ta.ex7ract@protonmail.ch"
+SEMANTIC_TRUTH_HASH = hashlib.sha256(SEMANTIC_TRUTH.lower().strip().encode()).hexdigest()
+
+
 async def seed_case_001():
     """Seed Case 001 into the database."""
     
@@ -30,25 +35,23 @@ async def seed_case_001():
             print(f"   ID: {existing.id}")
             return existing
         
-        # The semantic truth (the answer)
-        semantic_truth = "d4ta.ex7ract@protonmail.ch"
-        semantic_truth_hash = hashlib.sha256(
-            semantic_truth.lower().strip().encode()
-        ).hexdigest()
-        
         # Generate case salt for flag generation
         case_salt = secrets.token_hex(32)
         
-        case = Case(
-            title="The Disappearance",
-            slug="the-disappearance",
-            description="Marcus Chen, a senior software engineer at Nexus Dynamics, failed to appear for work on November 15th, 2024. His access badge wasn't used, his phone went straight to voicemail, and his apartment was found empty. HR initially assumed a family emergency, but when they couldn't reach him for 48 hours, they escalated to Security. A preliminary review of access logs showed unusual patterns in the days leading up to his disappearance. You've been brought in to investigate.",
-            story_background="""Marcus Chen was a senior software engineer at Nexus Dynamics, a defense contractor specializing in autonomous systems. He had been with the company for 4 years and had access to several classified projects.
+        # INSERT ... RETURNING hands back the new row (with its generated
+        # defaults) in the same round-trip, so no refresh is needed
+        case = await db.scalar(
+            insert(Case)
+            .values(
+                title="The Disappearance",
+                slug="the-disappearance",
+                description="Marcus Chen, a senior software engineer at Nexus Dynamics, failed to appear for work on November 15th, 2024. His access badge wasn't used, his phone went straight to voicemail, and his apartment was found empty. HR initially assumed a family emergency, but when they couldn't reach him for 48 hours, they escalated to Security. A preliminary review of access logs showed unusual patterns in the days leading up to his disappearance. You've been brought in to investigate.",
+                story_background="""Marcus Chen was a senior software engineer at Nexus Dynamics, a defense contractor specializing in autonomous systems. He had been with the company for 4 years and had access to several classified projects.
 
 On November 15th, 2024, Marcus failed to appear for work. His access badge wasn't used, his phone went straight to voicemail, and his apartment was found empty. Initial investigation revealed unusual patterns in the days leading up to his disappearance.
 
 Security has preserved several digital artifacts from Marcus's work accounts and devices for your analysis.""",
-            investigation_objectives="""Your task is to analyze the digital artifacts recovered from Marcus Chen's work accounts and devices. Security has already preserved:
+                investigation_objectives="""Your task is to analyze the digital artifacts recovered from Marcus Chen's work accounts and devices. Security has already preserved:
 
 1. A GitHub organization export
 2. His Telegram backup
@@ -63,38 +66,38 @@ Your primary objectives:
 - Recover the external contact email used for coordination
 
 The semantic truth you must discover is an email address.""",
-            difficulty=DifficultyLevel.INTERMEDIATE,
-            semantic_truth_hash=semantic_truth_hash,
-            case_salt=case_salt,
-            points=500,
-            extra_metadata={
-                "subtitle": "A Data Security Incident Investigation",
-                "estimated_time_minutes": 120,
-                "author": "CTF Platform",
-                "version": "1.0.0",
-                "skills_tested": [
-                    "Git forensics",
-                    "Metadata analysis",
-                    "Network traffic analysis",
-                    "Steganography detection",
-                    "File carving",
-                    "Timeline correlation"
-                ],
-                "tools_recommended": [
-                    "Wireshark",
-                    "ExifTool",
-                    "steghide",
-                    "photorec/scalpel",
-                    "jq",
-                    "Git"
-                ]
-            },
-            is_active=True,
+                difficulty=DifficultyLevel.INTERMEDIATE,
+                semantic_truth_hash=SEMANTIC_TRUTH_HASH,
+                case_salt=case_salt,
+                points=500,
+                extra_metadata={
+                    "subtitle": "A Data Security Incident Investigation",
+                    "estimated_time_minutes": 120,
+                    "author": "CTF Platform",
+                    "version": "1.0.0",
+                    "skills_tested": [
+                        "Git forensics",
+                        "Metadata analysis",
+                        "Network traffic analysis",
+                        "Steganography detection",
+                        "File carving",
+                        "Timeline correlation"
+                    ],
+                    "tools_recommended": [
+                        "Wireshark",
+                        "ExifTool",
+                        "steghide",
+                        "photorec/scalpel",
+                        "jq",
+                        "Git"
+                    ]
+                },
+                is_active=True,
+            )
+            .returning(Case)
         )
         
-        db.add(case)
         await db.commit()
-        await db.refresh(case)
         
         print("=" * 50)
         print("✅ Case 001 'The Disappearance' seeded!")
@@ -105,7 +108,7 @@ The semantic truth you must discover is an email address.""",
         print(f"Points: {case.points}")
         print(f"Active: {case.is_active}")
         print("=" * 50)
-        print(f"\n🔑 Semantic Truth: {semantic_truth}")
+        print(f"\n🔑 Semantic Truth: {SEMANTIC_TRUTH}")
         print("   (Users must discover this email address)")
         print("=" * 50)
         
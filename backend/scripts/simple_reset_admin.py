@@ -5,34 +5,35 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import text
-from app.core.security import SecurityService
-from app.db.session import get_sync_session
-
 
 def reset_admin():
     """Delete all users and create a new admin user."""
     
-    security_service = SecurityService()
+    # Imported here so importing this module stays cheap; the app package
+    # pulls in SQLAlchemy, argon2 and the settings
+    from sqlalchemy import text
+    from app.core.password_hasher import low_memory_hasher
+    from app.db.session import get_sync_session
+    
+    # Get admin credentials and hash the password before touching the
+    # database, so no connection sits idle in a transaction meanwhile
+    print("\nEnter admin credentials:")
+    email = input("Email: ").strip()
+    username = input("Username (default: admin): ").strip() or "admin"
+    password = input("Password: ").strip()
+    
+    password_hash = low_memory_hasher.hash(password)
     
     # Create session
     session = get_sync_session()
     
     try:
-        # Delete in correct order due to foreign key constraints
+        # Delete in correct order due to foreign key constraints; this
+        # commits together with the insert below
         session.execute(text("DELETE FROM invite_codes"))
         session.execute(text("DELETE FROM users"))
-        session.commit()
         print("Deleted all existing users and invite codes")
         
-        # Get admin credentials from user
-        print("\nEnter admin credentials:")
-        email = input("Email: ").strip()
-        username = input("Username (default: admin): ").strip() or "admin"
-        password = input("Password: ").strip()
-        
-        password_hash = security_service.hash_password(password)
-        
         # Insert admin user
         session.execute(text("""
             INSERT INTO users (email, username, password_hash, is_active, is_admin, invite_code_used, created_at, updated_at)
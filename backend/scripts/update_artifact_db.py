@@ -24,6 +24,10 @@ def update_artifact_paths():
     session = get_sync_session()
     
     try:
+        # One transaction for the whole run; the script is safe to re-run,
+        # so don't wait for the WAL flush on commit
+        session.execute(text("SET LOCAL synchronous_commit = OFF"))
+        
         # Get all artifacts for the case
         result = session.execute(text("""
             SELECT id, name, storage_path
@@ -34,6 +38,7 @@ def update_artifact_paths():
         artifacts = result.fetchall()
         print(f"Found {len(artifacts)} artifacts\n")
         
+        updates = []
         for artifact_id, name, current_path in artifacts:
             print(f"Artifact: {name}")
             print(f"  Current path: {current_path}")
@@ -41,21 +46,30 @@ def update_artifact_paths():
             if name in ARTIFACT_PATHS:
                 new_path = ARTIFACT_PATHS[name]
                 print(f"  New path: {new_path}")
-                
-                session.execute(text("""
-                    UPDATE artifacts
-                    SET storage_path = :new_path,
-                        file_size = 1048576
-                    WHERE id = :artifact_id
-                """), {
-                    "artifact_id": str(artifact_id),
-                    "new_path": new_path
-                })
-                print("  ✓ Updated")
+                updates.append((str(artifact_id), new_path))
             else:
                 print("  ⚠ No mapping found")
             print()
         
+        if updates:
+            # One UPDATE joined against a VALUES list instead of one per row
+            values_clause = ", ".join(
+                f"(:id{i}, :path{i})" for i in range(len(updates))
+            )
+            params = {}
+            for i, (artifact_id, new_path) in enumerate(updates):
+                params[f"id{i}"] = artifact_id
+                params[f"path{i}"] = new_path
+            
+            session.execute(text(f"""
+                UPDATE artifacts AS a
+                SET storage_path = v.path,
+                    file_size = 1048576
+                FROM (VALUES {values_clause}) AS v(id, path)
+                WHERE a.id = v.id::uuid
+            """), params)
+            print(f"✓ Updated {len(updates)} artifacts")
+        
         session.commit()
         print("\n✅ All artifact paths updated!")
         
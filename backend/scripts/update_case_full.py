@@ -3,7 +3,6 @@
 import sys
 import os
 import uuid
-import secrets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -76,6 +75,10 @@ def update_case():
     session = get_sync_session()
     
     try:
+        # Everything below is one transaction; the script is safe to re-run,
+        # so don't wait for the WAL flush on commit
+        session.execute(text("SET LOCAL synchronous_commit = OFF"))
+        
         # Get case ID
         result = session.execute(text("SELECT id, title FROM cases WHERE slug = 'the-disappearance'"))
         case_row = result.first()
@@ -100,38 +103,50 @@ def update_case():
             "story_background": BACKGROUND,
             "investigation_objectives": OBJECTIVES,
         })
-        session.commit()
         print("✓ Updated case story content")
         
-        # Check if artifacts already exist
-        result = session.execute(text("SELECT COUNT(*) FROM artifacts WHERE case_id = :case_id"), {"case_id": case_id})
-        artifact_count = result.scalar()
+        # Drop only artifacts that are no longer part of the case; the rest
+        # are updated in place so their ids (and download records) survive
+        result = session.execute(text("""
+            DELETE FROM artifacts
+            WHERE case_id = :case_id AND name <> ALL(:names)
+        """), {"case_id": case_id, "names": [artifact["name"] for artifact in ARTIFACTS]})
+        if result.rowcount:
+            print(f"Removed {result.rowcount} stale artifacts")
         
-        if artifact_count > 0:
-            print(f"Found {artifact_count} existing artifacts, deleting...")
-            session.execute(text("DELETE FROM artifacts WHERE case_id = :case_id"), {"case_id": case_id})
-            session.commit()
+        # Placeholder hashes for every artifact from a single urandom read
+        blob = os.urandom(32 * len(ARTIFACTS))
+        hashes = [blob[i * 32:(i + 1) * 32].hex() for i in range(len(ARTIFACTS))]
         
-        # Insert artifacts using actual column names from migration
-        for artifact in ARTIFACTS:
-            artifact_id = str(uuid.uuid4())
-            session.execute(text("""
-                INSERT INTO artifacts 
-                (id, case_id, name, description, artifact_type, storage_path, file_size, file_hash_sha256, mime_type, created_at, updated_at)
-                VALUES 
-                (:id, :case_id, :name, :description, :artifact_type, :storage_path, :file_size, :file_hash_sha256, :mime_type, NOW(), NOW())
-            """), {
-                "id": artifact_id,
+        # Upsert artifacts using actual column names from migration,
+        # all rows in one executemany. Existing rows keep their id, storage
+        # path, size and hash, which upload_artifacts_001 may have filled in.
+        session.execute(text("""
+            INSERT INTO artifacts 
+            (id, case_id, name, description, artifact_type, storage_path, file_size, file_hash_sha256, mime_type, created_at, updated_at)
+            VALUES 
+            (:id, :case_id, :name, :description, :artifact_type, :storage_path, :file_size, :file_hash_sha256, :mime_type, NOW(), NOW())
+            ON CONFLICT (case_id, name) DO UPDATE SET
+                description = EXCLUDED.description,
+                artifact_type = EXCLUDED.artifact_type,
+                mime_type = EXCLUDED.mime_type,
+                updated_at = NOW()
+        """), [
+            {
+                "id": str(uuid.uuid4()),
                 "case_id": case_id,
                 "name": artifact["name"],
                 "description": artifact["description"],
                 "artifact_type": artifact["artifact_type"],
                 "storage_path": artifact["storage_path"],
                 "file_size": 0,
-                "file_hash_sha256": secrets.token_hex(32),  # Placeholder hash
+                "file_hash_sha256": hashes[i],
                 "mime_type": artifact["mime_type"],
-            })
-            print(f"✓ Added artifact: {artifact['name']}")
+            }
+            for i, artifact in enumerate(ARTIFACTS)
+        ])
+        for artifact in ARTIFACTS:
+            print(f"✓ Upserted artifact: {artifact['name']}")
         
         session.commit()
         print(f"\n✅ Successfully updated case with full story and {len(ARTIFACTS)} artifacts!")
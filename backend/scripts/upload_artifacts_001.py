@@ -10,9 +10,9 @@ This script:
 
 import asyncio
 import hashlib
-import io
 import os
 import sys
+import tempfile
 import zipfile
 from pathlib import Path
 from uuid import UUID
@@ -25,12 +25,12 @@ if backend_path not in sys.path:
 os.chdir(backend_path)
 
 from minio import Minio
-from sqlalchemy import select, update
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from minio.error import S3Error
+from sqlalchemy import Row, select, update
 
-from app.core.config import settings
 from app.db.models import Artifact
+from app.db.session import SessionLocal, engine
+from app.utils.storage import storage_client
 
 # Case 001 ID
 CASE_ID = UUID("03a9a67b-5be9-41a7-8927-d14d49183166")
@@ -38,6 +38,13 @@ CASE_ID = UUID("03a9a67b-5be9-41a7-8927-d14d49183166")
 # Artifacts base path
 ARTIFACTS_BASE = Path(__file__).parent.parent.parent / "cases" / "001-the-disappearance" / "artifacts"
 
+# Folders zipped and uploaded at the same time
+UPLOAD_CONCURRENCY = 4
+
+# Multipart part size for large archives (the disk image); fewer, larger
+# parts than the 5 MiB minimum
+UPLOAD_PART_SIZE = 64 * 1024 * 1024
+
 # Artifact folder mappings (folder_name -> artifact_name in DB)
 ARTIFACT_MAPPINGS = {
     "github_export": "GitHub Organization Export",
@@ -48,30 +55,191 @@ ARTIFACT_MAPPINGS = {
 }
 
 
-def create_zip_from_folder(folder_path: Path) -> tuple[bytes, int, str]:
+# Archives up to this size stay in memory, larger ones spill to disk
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# DEFLATE level for the archives (zlib default is 6); set
+# ARTIFACT_ZIP_LEVEL=1 for quick re-uploads while iterating on a case
+ZIP_COMPRESS_LEVEL = int(os.getenv("ARTIFACT_ZIP_LEVEL", "6"))
+
+# Files that are already compressed; deflating them again costs CPU for
+# next to no size reduction, so they are stored as-is
+STORED_SUFFIXES = frozenset({
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".zst",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".mp3",
+})
+
+
+class HashingWriter:
+    """
+    Write-only file wrapper that hashes and counts bytes as they pass.
+    
+    It has no seek(), so zipfile writes the archive front to back (with
+    data descriptors) and the running digest matches the final file.
+    """
+    
+    def __init__(self, fp):
+        self.fp = fp
+        self.h = hashlib.sha256()
+        self.size = 0
+    
+    def write(self, data) -> int:
+        self.h.update(data)
+        self.fp.write(data)
+        self.size += len(data)
+        return len(data)
+    
+    def flush(self) -> None:
+        self.fp.flush()
+
+
+def iter_folder_files(folder: str):
+    """
+    Yield (path, arcname) for every file below a folder.
+    
+    Uses os.scandir directly, so no Path objects are built per file and
+    the file type comes from the directory entry without an extra stat.
+    """
+    prefix_len = len(folder) + 1
+    stack = [folder]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.path[prefix_len:]
+
+
+def folder_fingerprint(folder: str) -> list[int]:
+    """
+    Cheap change detector for an artifact folder.
+    
+    Returns:
+        [newest mtime in ns, total size, file count] of the files below it
+    """
+    newest = total_size = count = 0
+    for file_path, _ in iter_folder_files(folder):
+        st = os.stat(file_path)
+        newest = max(newest, st.st_mtime_ns)
+        total_size += st.st_size
+        count += 1
+    return [newest, total_size, count]
+
+
+def create_zip_from_folder(folder_path: Path) -> tuple[tempfile.SpooledTemporaryFile, int, str]:
     """
     Create a ZIP archive from a folder.
     
+    The archive is written to a spooled temporary file and hashed while it
+    is written, so large folders are never held in memory as a whole.
+    
     Returns:
-        Tuple of (zip_bytes, file_size, sha256_hash)
+        Tuple of (zip_file, file_size, sha256_hash); zip_file is positioned
+        at the start and must be closed by the caller
     """
-    buffer = io.BytesIO()
+    fp = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE)
+    writer = HashingWriter(fp)
     
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(folder_path)
+    with zipfile.ZipFile(
+        writer, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL
+    ) as zf:
+        for file_path, arcname in iter_folder_files(str(folder_path)):
+            if os.path.splitext(file_path)[1].lower() in STORED_SUFFIXES:
+                zf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
                 zf.write(file_path, arcname)
     
-    buffer.seek(0)
-    zip_bytes = buffer.read()
-    file_size = len(zip_bytes)
+    fp.seek(0)
+    
+    return fp, writer.size, writer.h.hexdigest()
+
+
+async def object_exists(minio_client: Minio, bucket_name: str, object_name: str) -> bool:
+    """Check that an object is present in the bucket."""
+    try:
+        await asyncio.to_thread(
+            minio_client.stat_object,
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
+        return True
+    except S3Error:
+        return False
+
+
+async def upload_artifact_folder(
+    minio_client: Minio,
+    bucket_name: str,
+    semaphore: asyncio.Semaphore,
+    folder_name: str,
+    artifact: Row | None,
+) -> dict | None:
+    """
+    Zip, hash and upload one artifact folder.
+    
+    The blocking zip and MinIO calls run in worker threads, so several
+    folders can be processed at once. A folder is skipped when its
+    fingerprint matches the one stored in the artifact's extra_metadata,
+    the artifact still points at this script's object and that object
+    exists in MinIO.
+    
+    Returns:
+        Bulk UPDATE row for the artifact, or None if it was skipped
+    """
+    folder_path = ARTIFACTS_BASE / folder_name
+    
+    if not folder_path.exists():
+        print(f"Warning: Folder not found: {folder_name}")
+        return None
+    
+    if artifact is None:
+        print(f"Warning: Artifact not in DB for folder: {folder_name}")
+        return None
     
-    # Calculate SHA256
-    sha256_hash = hashlib.sha256(zip_bytes).hexdigest()
+    object_name = f"cases/{CASE_ID}/{folder_name}.zip"
+    storage_path = f"{bucket_name}/{object_name}"
+    
+    async with semaphore:
+        # Skip folders that haven't changed since the last upload
+        fingerprint = await asyncio.to_thread(folder_fingerprint, str(folder_path))
+        extra_metadata = artifact.extra_metadata or {}
+        if (
+            extra_metadata.get("fingerprint") == fingerprint
+            and artifact.storage_path == storage_path
+            and await object_exists(minio_client, bucket_name, object_name)
+        ):
+            print(f"[{folder_name}] Unchanged since last upload, skipping")
+            return None
+        
+        print(f"[{folder_name}] Zipping folder...")
+        zip_file, file_size, sha256_hash = await asyncio.to_thread(
+            create_zip_from_folder, folder_path
+        )
+        print(f"[{folder_name}] Size: {file_size / (1024*1024):.2f} MB, SHA256: {sha256_hash[:16]}...")
+        
+        # Upload to MinIO
+        print(f"[{folder_name}] Uploading to MinIO...")
+        
+        with zip_file:
+            await asyncio.to_thread(
+                minio_client.put_object,
+                bucket_name=bucket_name,
+                object_name=object_name,
+                data=zip_file,
+                length=file_size,
+                part_size=UPLOAD_PART_SIZE,
+                content_type="application/zip",
+            )
+        print(f"[{folder_name}] Uploaded: {object_name}")
     
-    return zip_bytes, file_size, sha256_hash
+    return {
+        "id": artifact.id,
+        "storage_path": storage_path,
+        "file_size": file_size,
+        "file_hash_sha256": sha256_hash,
+        "extra_metadata": {**extra_metadata, "fingerprint": fingerprint},
+    }
 
 
 async def main():
@@ -82,32 +250,20 @@ async def main():
         print(f"Error: Artifacts folder not found: {ARTIFACTS_BASE}")
         return
     
-    # Initialize MinIO client
-    minio_client = Minio(
-        endpoint=settings.MINIO_ENDPOINT,
-        access_key=settings.MINIO_ACCESS_KEY,
-        secret_key=settings.MINIO_SECRET_KEY,
-        secure=settings.MINIO_USE_SSL,
-    )
-    
-    # Ensure bucket exists
-    bucket_name = settings.MINIO_BUCKET_NAME
-    if not minio_client.bucket_exists(bucket_name):
-        minio_client.make_bucket(bucket_name)
-        print(f"Created bucket: {bucket_name}")
-    else:
-        print(f"Bucket exists: {bucket_name}")
-    
-    # Database connection
-    engine = create_async_engine(settings.DATABASE_URL)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    
-    async with async_session() as db:
+    # Reuse the app's storage client and its bucket check
+    minio_client = storage_client.client
+    bucket_name = storage_client.bucket_name
+    await storage_client.ensure_bucket_exists()
+    print(f"Bucket ready: {bucket_name}")
+    
+    # Use the app's engine and session factory rather than a one-off engine
+    async with SessionLocal() as db:
         # Get existing artifacts for this case
         result = await db.execute(
-            select(Artifact).where(Artifact.case_id == CASE_ID)
+            select(Artifact.id, Artifact.name, Artifact.storage_path, Artifact.extra_metadata)
+            .where(Artifact.case_id == CASE_ID)
         )
-        artifacts = {a.name: a for a in result.scalars().all()}
+        artifacts = {row.name: row for row in result.all()}
         
         if not artifacts:
             print("No artifacts found in database for Case 001")
@@ -116,51 +272,22 @@ async def main():
         
         print(f"Found {len(artifacts)} artifacts in database\n")
         
-        # Process each artifact folder
-        for folder_name, artifact_name in ARTIFACT_MAPPINGS.items():
-            folder_path = ARTIFACTS_BASE / folder_name
-            
-            if not folder_path.exists():
-                print(f"Warning: Folder not found: {folder_name}")
-                continue
-            
-            if artifact_name not in artifacts:
-                print(f"Warning: Artifact not in DB: {artifact_name}")
-                continue
-            
-            artifact = artifacts[artifact_name]
-            print(f"Processing: {folder_name}")
-            
-            # Create ZIP
-            print(f"   Zipping folder...")
-            zip_bytes, file_size, sha256_hash = create_zip_from_folder(folder_path)
-            print(f"   Size: {file_size / (1024*1024):.2f} MB")
-            print(f"   SHA256: {sha256_hash[:16]}...")
-            
-            # Upload to MinIO
-            object_name = f"cases/{CASE_ID}/{folder_name}.zip"
-            print(f"   Uploading to MinIO...")
-            
-            minio_client.put_object(
-                bucket_name=bucket_name,
-                object_name=object_name,
-                data=io.BytesIO(zip_bytes),
-                length=file_size,
-                content_type="application/zip",
-            )
-            print(f"   Uploaded: {object_name}")
-            
-            # Update database record
-            await db.execute(
-                update(Artifact)
-                .where(Artifact.id == artifact.id)
-                .values(
-                    storage_path=f"{bucket_name}/{object_name}",
-                    file_size=file_size,
-                    file_hash_sha256=sha256_hash,
-                )
+        # Zip, hash and upload the folders concurrently; updates are
+        # applied in one bulk UPDATE once all uploads are done
+        semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+        results = await asyncio.gather(*[
+            upload_artifact_folder(
+                minio_client, bucket_name, semaphore, folder_name, artifacts.get(artifact_name)
             )
-            print(f"   Database updated\n")
+            for folder_name, artifact_name in ARTIFACT_MAPPINGS.items()
+        ])
+        updates = [row for row in results if row is not None]
+        print()
+        
+        # ORM bulk UPDATE by primary key, executed as one executemany
+        if updates:
+            await db.execute(update(Artifact), updates)
+            print(f"Database updated ({len(updates)} artifacts)\n")
         
         await db.commit()
     
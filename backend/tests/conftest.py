@@ -8,8 +8,9 @@ from typing import AsyncGenerator, Generator
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 from app.db.base import Base
@@ -17,24 +18,39 @@ from app.db.session import get_db
 from main import app
 
 
-# Test database URL (use SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Test database URL (in-memory SQLite; no file I/O)
+TEST_DATABASE_URL = "sqlite+aiosqlite://"
 
 
-# Create test engine
+# Create test engine. StaticPool hands out the one underlying connection,
+# so the in-memory database lives for the whole test session.
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
-    poolclass=NullPool,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
 )
 
-# Test session factory
+
+# The sqlite3 driver manages transactions itself and breaks SAVEPOINTs;
+# take over so each test can run inside a transaction that is rolled back
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Test session factory; commits inside a test only release a SAVEPOINT
 TestSessionLocal = async_sessionmaker(
-    bind=test_engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
+    join_transaction_mode="create_savepoint",
 )
 
 
@@ -46,23 +62,30 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Create a fresh database session for each test.
-    Creates all tables before the test and drops them after.
-    """
-    # Create all tables
+@pytest_asyncio.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create all tables once for the test session."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    # Create session
-    async with TestSessionLocal() as session:
-        yield session
+    yield
     
-    # Drop all tables
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(db_schema) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a fresh database session for each test.
+    Everything the test writes is rolled back afterwards.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        
+        async with TestSessionLocal(bind=conn) as session:
+            yield session
+        
+        await trans.rollback()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -84,6 +107,26 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+class FakeClock:
+    """Stand-in for the time module with a settable monotonic clock."""
+    
+    def __init__(self, now: float = 6000.0):
+        # A multiple of 60, so tests start at a minute boundary
+        self.now = now
+    
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """
+    Settable clock; patch it over the `time` module of the code under test
+    (not the global one the event loop uses).
+    """
+    return FakeClock()
+
+
 @pytest.fixture
 def test_user_data() -> dict:
     """Sample user data for testing."""
@@ -0,0 +1,123 @@
+"""
+Tests for the in-memory RateLimiter.
+"""
+
+import pytest
+
+from app.utils import rate_limiter as rate_limiter_module
+from app.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch, fake_clock):
+    """Patch the rate limiter's clock."""
+    monkeypatch.setattr(rate_limiter_module, "time", fake_clock)
+    return fake_clock
+
+
+class TestRateLimiter:
+    """Test suite for the sliding window counter RateLimiter."""
+    
+    @pytest.mark.asyncio
+    async def test_limit_within_one_window(self, clock):
+        """Test that requests beyond the limit are rejected within a window."""
+        limiter = RateLimiter(requests_per_minute=3)
+        
+        results = []
+        for _ in range(4):
+            results.append(await limiter.is_allowed("user"))
+            clock.now += 1
+        
+        assert results == [True, True, True, False]
+        # Other keys have their own budget
+        assert await limiter.is_allowed("other") is True
+    
+    @pytest.mark.asyncio
+    async def test_get_remaining(self, clock):
+        """Test remaining requests and time until the window ends."""
+        limiter = RateLimiter(requests_per_minute=5)
+        
+        clock.now += 20
+        await limiter.is_allowed("user")
+        await limiter.is_allowed("user")
+        
+        remaining, reset_in = await limiter.get_remaining("user")
+        assert remaining == 3
+        assert reset_in == pytest.approx(40)
+        
+        assert await limiter.get_remaining("unknown") == (5, 0.0)
+    
+    @pytest.mark.asyncio
+    async def test_previous_window_carries_over_weighted(self, clock):
+        """Test that the previous window counts in proportion to its overlap."""
+        limiter = RateLimiter(requests_per_minute=10)
+        
+        clock.now += 30
+        for _ in range(10):
+            assert await limiter.is_allowed("user") is True
+        assert await limiter.is_allowed("user") is False
+        
+        # Halfway through the next window half of the old requests still count
+        clock.now += 60
+        results = [await limiter.is_allowed("user") for _ in range(6)]
+        assert results == [True] * 5 + [False]
+        
+        # Two windows later nothing carries over
+        clock.now += 120
+        results = [await limiter.is_allowed("user") for _ in range(11)]
+        assert results == [True] * 10 + [False]
+    
+    @pytest.mark.asyncio
+    async def test_evicts_idle_keys_when_full(self, clock):
+        """Test that keys idle for two windows make room for new keys."""
+        limiter = RateLimiter(requests_per_minute=1, max_keys=2)
+        
+        await limiter.is_allowed("a")
+        clock.now += 60
+        await limiter.is_allowed("b")
+        clock.now += 65
+        
+        # "a" is idle and makes room; "b" still counts and is kept
+        assert await limiter.is_allowed("c") is True
+        assert await limiter.is_allowed("d") is False
+        assert await limiter.is_allowed("b") is False
+    
+    @pytest.mark.asyncio
+    async def test_rejects_new_keys_when_full_of_live_keys(self, clock):
+        """Test that live counters are never evicted to make room."""
+        limiter = RateLimiter(requests_per_minute=1, max_keys=2)
+        
+        assert await limiter.is_allowed("a") is True
+        assert await limiter.is_allowed("b") is True
+        
+        assert await limiter.is_allowed("c") is False
+        # Existing keys keep their counts
+        assert await limiter.is_allowed("a") is False
+        
+        # Once the tracked keys go idle, the new key gets a slot
+        clock.now += 120
+        assert await limiter.is_allowed("c") is True
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_keys_idle_for_two_windows(self, clock):
+        """Test that cleanup removes only keys that no longer count."""
+        limiter = RateLimiter(requests_per_minute=5)
+        
+        await limiter.is_allowed("old")
+        clock.now += 60
+        await limiter.is_allowed("recent")
+        clock.now += 65
+        
+        assert await limiter.cleanup(batch_size=1) == 1
+        assert list(limiter._counters) == ["recent"]
+    
+    @pytest.mark.asyncio
+    async def test_reset(self, clock):
+        """Test that reset clears a key's counters."""
+        limiter = RateLimiter(requests_per_minute=1)
+        
+        assert await limiter.is_allowed("user") is True
+        assert await limiter.is_allowed("user") is False
+        
+        await limiter.reset("user")
+        assert await limiter.is_allowed("user") is True
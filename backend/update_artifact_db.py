@@ -15,11 +15,9 @@ if backend_path not in sys.path:
     sys.path.insert(0, backend_path)
 
 from sqlalchemy import select, update
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 
-from app.core.config import settings
 from app.db.models import Artifact
+from app.db.session import SessionLocal, engine
 
 # Case 001 ID
 CASE_ID = UUID("03a9a67b-5be9-41a7-8927-d14d49183166")
@@ -47,26 +45,24 @@ ARTIFACT_DATA = {
 async def main():
     print("Updating artifact database records...\n")
     
-    # Database connection
-    engine = create_async_engine(settings.DATABASE_URL)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    
-    async with async_session() as db:
+    # Use the app's engine and session factory rather than a one-off engine
+    async with SessionLocal() as db:
         # Get artifacts for this case
         result = await db.execute(
-            select(Artifact).where(Artifact.case_id == CASE_ID)
+            select(Artifact.id, Artifact.name).where(Artifact.case_id == CASE_ID)
         )
-        artifacts = {a.name: a for a in result.scalars().all()}
+        artifact_ids = {name: artifact_id for artifact_id, name in result.all()}
         
-        if not artifacts:
+        if not artifact_ids:
             print("No artifacts found in database!")
             return
         
-        print(f"Found {len(artifacts)} artifacts in database")
+        print(f"Found {len(artifact_ids)} artifacts in database")
         
-        # Update each artifact
+        # Collect the updates and apply them in one bulk UPDATE
+        updates = []
         for artifact_name, data in ARTIFACT_DATA.items():
-            if artifact_name not in artifacts:
+            if artifact_name not in artifact_ids:
                 print(f"Warning: {artifact_name} not found in DB")
                 continue
             
@@ -74,14 +70,15 @@ async def main():
             print(f"   Storage: {data['storage_path']}")
             print(f"   Size: {data['file_size']} bytes")
             
-            await db.execute(
-                update(Artifact)
-                .where(Artifact.id == artifacts[artifact_name].id)
-                .values(
-                    storage_path=data["storage_path"],
-                    file_size=data["file_size"],
-                )
-            )
+            updates.append({
+                "id": artifact_ids[artifact_name],
+                "storage_path": data["storage_path"],
+                "file_size": data["file_size"],
+            })
+        
+        # ORM bulk UPDATE by primary key, executed as one executemany
+        if updates:
+            await db.execute(update(Artifact), updates)
         
         await db.commit()
     
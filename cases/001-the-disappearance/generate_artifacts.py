@@ -11,8 +11,11 @@ import os
 import sys
 import json
 import base64
+import bisect
 import hashlib
+import itertools
 import random
+import string
 import struct
 import codecs
 from datetime import datetime, timedelta, timezone
@@ -20,6 +23,11 @@ from pathlib import Path
 from typing import List, Dict, Any
 import secrets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # CONFIGURATION - THE TRUTH
@@ -43,6 +51,21 @@ DISAPPEARANCE_TIME = datetime(2024, 11, 15, 8, 0, 0, tzinfo=timezone.utc)
 # ENCODING UTILITIES
 # ============================================================================
 
+def _isoformat_default(obj: Any) -> str:
+    """stdlib json fallback for datetimes, matching orjson's RFC 3339 output."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path: Path, obj: Any):
+    """Write obj as indented JSON (orjson when available, else stdlib json)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, indent=2, default=_isoformat_default), encoding='utf-8')
+
+
 def rot13(text: str) -> str:
     """Apply ROT13 encoding."""
     return codecs.encode(text, 'rot_13')
@@ -55,22 +78,44 @@ def encode_email_obfuscated(email: str) -> str:
     return encoded
 
 
+def _byte_table(alphabet: bytes) -> bytes:
+    """Map every byte value onto the alphabet (slight modulo bias is fine for noise)."""
+    return bytes(alphabet[b % len(alphabet)] for b in range(256))
+
+
+_DIGITS_TABLE = _byte_table(b"0123456789")
+_ALNUM_TABLE = _byte_table(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+
+def _random_string(table: bytes, length: int) -> str:
+    """Random string from a single urandom draw."""
+    return os.urandom(length).translate(table).decode()
+
+
 def generate_fake_api_key() -> str:
     """Generate a realistic-looking fake API key."""
     prefixes = ["sk_live_", "api_", "ghp_", "AKIA", "xoxb-"]
     prefix = random.choice(prefixes)
     if prefix == "AKIA":
-        return prefix + ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ234567', k=16))
+        # 10 random bytes are exactly 16 base32 characters
+        return prefix + base64.b32encode(os.urandom(10)).decode()
     elif prefix == "xoxb-":
         return prefix + '-'.join([
-            ''.join(random.choices('0123456789', k=12)),
-            ''.join(random.choices('0123456789', k=12)),
-            ''.join(random.choices('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', k=24))
+            _random_string(_DIGITS_TABLE, 12),
+            _random_string(_DIGITS_TABLE, 12),
+            _random_string(_ALNUM_TABLE, 24),
         ])
     else:
         return prefix + secrets.token_hex(24)
 
 
+def random_hex_ids(count: int, nbytes: int) -> List[str]:
+    """Generate count random hex strings of nbytes each from a single urandom draw."""
+    blob = os.urandom(count * nbytes).hex()
+    width = 2 * nbytes
+    return [blob[i:i + width] for i in range(0, len(blob), width)]
+
+
 def generate_fake_email() -> str:
     """Generate a fake noise email."""
     names = ["john", "jane", "admin", "support", "dev", "test", "user", "notify", "alert", "system"]
@@ -144,8 +189,7 @@ def generate_repository(github_dir: Path, repo_config: dict):
     
     # Write commits log
     commits_file = repo_dir / "commits.json"
-    with open(commits_file, 'w', encoding='utf-8') as f:
-        json.dump(commits, f, indent=2, default=str)
+    write_json(commits_file, commits)
     
     # Generate file snapshots for key commits
     if repo_config.get("is_critical"):
@@ -199,15 +243,21 @@ def generate_commit_history(repo_name: str, is_critical: bool) -> List[Dict]:
         {"name": "DevOps Bot", "email": "devops@nexusdyn.com"},
     ]
     
+    # Draw every per-commit random value up front, one call per field
+    hours_deltas = random.choices(range(1, 73), k=num_commits)
+    tz_offsets = random.choices([0, 0, 0, -8, -5, +1, +8], k=num_commits)  # Mostly UTC
+    messages = random.choices(commit_messages, k=num_commits)
+    commit_authors = random.choices(authors, k=num_commits)
+    files_changed = random.choices(range(1, 16), k=num_commits)
+    additions = random.choices(range(5, 501), k=num_commits)
+    deletions = random.choices(range(0, 201), k=num_commits)
+    shas = random_hex_ids(num_commits, 20)
+    
     for i in range(num_commits):
         # Progress time randomly
-        hours_delta = random.randint(1, 72)
-        base_time += timedelta(hours=hours_delta)
-        
-        # Random timezone shift (red herring)
-        tz_offset = random.choice([0, 0, 0, -8, -5, +1, +8])  # Mostly UTC
+        base_time += timedelta(hours=hours_deltas[i])
         
-        message = random.choice(commit_messages)
+        message = messages[i]
         if "{}" in message:
             message = message.format(
                 random.randint(1, 3),
@@ -215,17 +265,15 @@ def generate_commit_history(repo_name: str, is_critical: bool) -> List[Dict]:
                 random.randint(0, 99)
             )
         
-        author = random.choice(authors)
-        
         commit = {
-            "sha": secrets.token_hex(20),
+            "sha": shas[i],
             "message": message,
-            "author": author,
+            "author": commit_authors[i],
             "timestamp": base_time.isoformat(),
-            "timezone_offset": tz_offset,
-            "files_changed": random.randint(1, 15),
-            "additions": random.randint(5, 500),
-            "deletions": random.randint(0, 200),
+            "timezone_offset": tz_offsets[i],  # Random timezone shift (red herring)
+            "files_changed": files_changed[i],
+            "additions": additions[i],
+            "deletions": deletions[i],
         }
         
         # Insert fake API keys in some commits (red herrings)
@@ -252,12 +300,11 @@ def generate_commit_history(repo_name: str, is_critical: bool) -> List[Dict]:
             ],
         }
         
-        # Find appropriate position (early September 2024)
-        insert_pos = 0
-        for i, c in enumerate(commits):
-            if datetime.fromisoformat(c["timestamp"]) > CRITICAL_COMMIT_TIME:
-                insert_pos = i
-                break
+        # Find appropriate position (early September 2024); commits are in
+        # time order and their UTC ISO timestamps compare chronologically
+        insert_pos = bisect.bisect_right(
+            commits, critical_commit["timestamp"], key=lambda c: c["timestamp"]
+        )
         commits.insert(insert_pos, critical_commit)
         
         # Add the suspicious empty commit near disappearance
@@ -397,23 +444,23 @@ def generate_fork_repository(github_dir: Path, fork_config: dict):
     fork_dir.mkdir(parents=True, exist_ok=True)
     
     # Suspicious-looking but meaningless commits
+    shas = random_hex_ids(2, 20)
     commits = [
         {
-            "sha": secrets.token_hex(20),
+            "sha": shas[0],
             "message": "test: experimental data export",
             "author": {"name": "Marcus Chen", "email": "mchen@nexusdyn.com"},
             "timestamp": (DISAPPEARANCE_TIME - timedelta(days=30)).isoformat(),
         },
         {
-            "sha": secrets.token_hex(20),
+            "sha": shas[1],
             "message": "feat: add encrypted output option",
             "author": {"name": "Marcus Chen", "email": "mchen@nexusdyn.com"},
             "timestamp": (DISAPPEARANCE_TIME - timedelta(days=25)).isoformat(),
         },
     ]
     
-    with open(fork_dir / "commits.json", 'w', encoding='utf-8') as f:
-        json.dump(commits, f, indent=2)
+    write_json(fork_dir / "commits.json", commits)
     
     # Misleading README
     readme = f"""# {fork_config['name']}
@@ -440,11 +487,9 @@ Testing some experimental features for internal use.
         f.write(readme)
 
 
-def generate_misleading_readme(repo_name: str) -> str:
-    """Generate intentionally misleading README content."""
-    
-    readmes = {
-        "internal-tools": """# Internal Tools
+# README text per repository (intentionally misleading), built once at import
+MISLEADING_READMES = {
+    "internal-tools": """# Internal Tools
 
 A collection of internal development utilities.
 
@@ -472,7 +517,7 @@ For access requests, contact IT Security.
 
 *Last audit: 2024-09-01*
 """,
-        "customer-portal": """# Customer Portal
+    "customer-portal": """# Customer Portal
 
 Customer-facing web application.
 
@@ -496,7 +541,7 @@ PII handling follows GDPR requirements.
 
 *Version 4.2.1*
 """,
-        "api-gateway": """# API Gateway
+    "api-gateway": """# API Gateway
 
 Central API gateway and routing service.
 
@@ -519,9 +564,13 @@ Metrics exposed at `/metrics` (internal only)
 
 *Uptime target: 99.9%*
 """,
-    }
+}
+
+
+def generate_misleading_readme(repo_name: str) -> str:
+    """Generate intentionally misleading README content."""
     
-    return readmes.get(repo_name, "# Repository\n\nNo description provided.")
+    return MISLEADING_READMES.get(repo_name, "# Repository\n\nNo description provided.")
 
 
 def generate_org_metadata(github_dir: Path):
@@ -539,12 +588,11 @@ def generate_org_metadata(github_dir: Path):
                 {"login": "mchen-dev", "role": "member", "status": "inactive"},
             ],
         },
-        "export_date": datetime.now(timezone.utc).isoformat(),
+        "export_date": datetime.now(timezone.utc),
         "export_reason": "Security audit - Employee departure",
     }
     
-    with open(github_dir / "org_metadata.json", 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
+    write_json(github_dir / "org_metadata.json", metadata)
 
 
 # ============================================================================
@@ -577,11 +625,10 @@ def generate_telegram_export(output_dir: Path):
         ],
     }
     
-    # Insert at appropriate position
-    messages.append(critical_message)
-    
-    # Sort by timestamp
-    messages.sort(key=lambda m: m["date"])
+    # Insert at its position by timestamp; the noise is already in date order
+    # (ISO strings with the same offset sort chronologically)
+    pos = bisect.bisect_right(messages, critical_message["date"], key=lambda m: m["date"])
+    messages.insert(pos, critical_message)
     
     # Add message IDs
     for i, msg in enumerate(messages):
@@ -595,8 +642,7 @@ def generate_telegram_export(output_dir: Path):
         "messages": messages,
     }
     
-    with open(telegram_dir / "result.json", 'w', encoding='utf-8') as f:
-        json.dump(export, f, indent=2, default=str)
+    write_json(telegram_dir / "result.json", export)
 
 
 def generate_telegram_noise(count: int) -> List[Dict]:
@@ -643,43 +689,57 @@ def generate_telegram_noise(count: int) -> List[Dict]:
     greetings = ["Morning", "Hey", "Hi", "Hello", "Yo"]
     reactions = ["same", "mood", "this", "true", "big if true"]
     
-    messages = []
+    usernames = list(users)
+    
+    # Placeholder values are only drawn for the fields a template uses
+    field_values = {
+        "topic": lambda: random.choice(topics),
+        "env": lambda: random.choice(envs),
+        "link": lambda: f"https://github.com/nexus-dynamics-org/internal-tools/pull/{random.randint(100, 999)}",
+        "name": lambda: random.choice(usernames),
+        "reaction": lambda: random.choice(reactions),
+        "service": lambda: random.choice(services),
+        "greeting": lambda: random.choice(greetings),
+        "announcement": lambda: f"Version {random.randint(1,5)}.{random.randint(0,20)}.{random.randint(0,99)} released",
+        "problem": lambda: f"issue #{random.randint(1000, 9999)}",
+        "task": lambda: f"JIRA-{random.randint(1000, 9999)}",
+        "url": lambda: f"https://medium.com/article-{random.randint(10000, 99999)}",
+        "component": lambda: random.choice(("auth", "api", "frontend", "database", "cache")),
+    }
+    
+    # Parse each template's placeholder names once
+    formatter = string.Formatter()
+    templates = [
+        (template, [field for _, field, _, _ in formatter.parse(template) if field])
+        for template in message_templates
+    ]
+    
+    # Draw the per-message values up front, one call per column
+    minutes_deltas = random.choices(range(1, 121), k=count)
+    senders = random.choices(usernames, k=count)  # Users keep consistent IDs
+    chosen_templates = random.choices(templates, k=count)
+    
+    # Time progresses by the drawn number of minutes per message
     base_time = datetime(2024, 6, 1, 9, 0, 0, tzinfo=timezone.utc)
+    dates = [
+        (base_time + timedelta(minutes=elapsed)).isoformat()
+        for elapsed in itertools.accumulate(minutes_deltas)
+    ]
+    texts = [
+        template.format(**{field: field_values[field]() for field in fields})
+        for template, fields in chosen_templates
+    ]
     
-    for i in range(count):
-        # Progress time
-        base_time += timedelta(minutes=random.randint(1, 120))
-        
-        # Select a user (with consistent ID)
-        username = random.choice(list(users.keys()))
-        
-        template = random.choice(message_templates)
-        text = template.format(
-            topic=random.choice(topics),
-            env=random.choice(envs),
-            link=f"https://github.com/nexus-dynamics-org/internal-tools/pull/{random.randint(100, 999)}",
-            name=random.choice(list(users.keys())),
-            reaction=random.choice(reactions),
-            service=random.choice(services),
-            greeting=random.choice(greetings),
-            announcement=f"Version {random.randint(1,5)}.{random.randint(0,20)}.{random.randint(0,99)} released",
-            problem=f"issue #{random.randint(1000, 9999)}",
-            task=f"JIRA-{random.randint(1000, 9999)}",
-            url=f"https://medium.com/article-{random.randint(10000, 99999)}",
-            component=random.choice(["auth", "api", "frontend", "database", "cache"]),
-        )
-        
-        msg = {
+    return [
+        {
             "type": "message",
-            "date": base_time.isoformat(),
+            "date": date,
             "from": username,
             "from_id": users[username],  # Consistent ID per user
             "text": text,
         }
-        
-        messages.append(msg)
-    
-    return messages
+        for date, username, text in zip(dates, senders, texts)
+    ]
 
 
 # ============================================================================
@@ -701,8 +761,12 @@ def generate_image_dump(output_dir: Path):
     }
     
     # Generate 310 noise image metadata entries
+    meme_ids = iter(random_hex_ids(310, 4))
+    img_types = random.choices(["screenshot", "photo", "meme", "wallpaper", "receipt"], k=310)
+    sizes = random.choices(range(50000, 5000001), k=310)
+    created_days = random.choices(range(0, 319), k=310)
     for i in range(310):
-        img_type = random.choice(["screenshot", "photo", "meme", "wallpaper", "receipt"])
+        img_type = img_types[i]
         
         if img_type == "screenshot":
             # Screenshots must be dated BEFORE export date (Nov 15, 2024)
@@ -713,7 +777,7 @@ def generate_image_dump(output_dir: Path):
         elif img_type == "photo":
             filename = f"IMG_{random.randint(1000, 9999)}.jpg"
         elif img_type == "meme":
-            filename = f"meme_{secrets.token_hex(4)}.jpg"
+            filename = f"meme_{next(meme_ids)}.jpg"
         elif img_type == "wallpaper":
             filename = f"wallpaper_abstract_{i:03d}.png"
         else:
@@ -721,17 +785,17 @@ def generate_image_dump(output_dir: Path):
         
         entry = {
             "filename": filename,
-            "size_bytes": random.randint(50000, 5000000),
-            "created": (datetime(2024, 1, 1) + timedelta(days=random.randint(0, 318))).isoformat(),
+            "size_bytes": sizes[i],
+            "created": (datetime(2024, 1, 1) + timedelta(days=created_days[i])).isoformat(),
             "type": img_type,
         }
         
         # Add random EXIF noise - ensure make/model consistency
         if random.random() < 0.3:
             # Device make determines valid models
-            make = random.choice(["Apple", "Apple", "Apple", None])  # iPhone 13 device
+            make = random.choice(("Apple", "Apple", "Apple", None))  # iPhone 13 device
             if make == "Apple":
-                model = random.choice(["iPhone 13", "iPhone 13 Pro", "iPhone 13", None])
+                model = random.choice(("iPhone 13", "iPhone 13 Pro", "iPhone 13", None))
             else:
                 model = None
             entry["exif"] = {
@@ -777,8 +841,7 @@ def generate_image_dump(output_dir: Path):
     }
     manifest["images"].append(critical_img_2)
     
-    with open(images_dir / "manifest.json", 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2)
+    write_json(images_dir / "manifest.json", manifest)
     
     # Create placeholder for actual image generation
     with open(images_dir / "GENERATE_IMAGES.md", 'w', encoding='utf-8') as f:
@@ -822,8 +885,8 @@ def generate_pcap_metadata(output_dir: Path):
     
     pcap_spec = {
         "capture_info": {
-            "start_time": (PCAP_BURST_TIME - timedelta(hours=24)).isoformat(),
-            "end_time": (PCAP_BURST_TIME + timedelta(hours=2)).isoformat(),
+            "start_time": PCAP_BURST_TIME - timedelta(hours=24),
+            "end_time": PCAP_BURST_TIME + timedelta(hours=2),
             "interface": "en0",
             "filter": "host 192.168.1.105",  # Subject's workstation
         },
@@ -844,7 +907,7 @@ def generate_pcap_metadata(output_dir: Path):
             {"dest": "nexusdyn.com", "packets": 94872, "type": "internal"},
         ],
         "critical_traffic": {
-            "timestamp": PCAP_BURST_TIME.isoformat(),
+            "timestamp": PCAP_BURST_TIME,
             "dest_ip": "104.21.67.185",  # Cloudflare-fronted paste service
             "dest_port": 443,
             "protocol": "TLS 1.3",
@@ -860,8 +923,7 @@ def generate_pcap_metadata(output_dir: Path):
         },
     }
     
-    with open(pcap_dir / "capture_spec.json", 'w', encoding='utf-8') as f:
-        json.dump(pcap_spec, f, indent=2)
+    write_json(pcap_dir / "capture_spec.json", pcap_spec)
     
     # Wireshark analysis notes
     analysis = """# Network Capture Analysis Notes
@@ -1029,8 +1091,7 @@ def generate_disk_image_spec(output_dir: Path):
     browser_history.extend(critical_entries)
     browser_history.sort(key=lambda x: x["visit_time"])
     
-    with open(disk_dir / "browser_history.json", 'w', encoding='utf-8') as f:
-        json.dump(browser_history, f, indent=2)
+    write_json(disk_dir / "browser_history.json", browser_history)
     
     # Shell history
     shell_history = []
@@ -1148,8 +1209,7 @@ hQEMA8qF+2j/CORRUPTED_HEADER_UNRECOVERABLE
         "analysis_notes": "Partial file recovery from deleted .notes.gpg reveals encrypted personal notes with fragments indicating coordination with external party",
     }
     
-    with open(disk_dir / "disk_spec.json", 'w', encoding='utf-8') as f:
-        json.dump(disk_spec, f, indent=2)
+    write_json(disk_dir / "disk_spec.json", disk_spec)
 
 
 # ============================================================================